@@ -6,5 +6,12 @@ This allows the package to be run with 'python -m databricks_mcp. or 'uv run dat
 import asyncio
 from databricks_mcp.main import main
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main()) 
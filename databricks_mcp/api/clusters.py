@@ -41,7 +41,7 @@ async def terminate_cluster(cluster_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Terminating cluster: {cluster_id}")
+    logger.info("Terminating cluster: %s", cluster_id)
     return await make_api_request("POST", "/api/2.0/clusters/delete", data={"cluster_id": cluster_id})
 
 
@@ -72,7 +72,7 @@ async def get_cluster(cluster_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting information for cluster: {cluster_id}")
+    logger.info("Getting information for cluster: %s", cluster_id)
     return await make_api_request("GET", "/api/2.0/clusters/get", params={"cluster_id": cluster_id})
 
 
@@ -89,7 +89,7 @@ async def start_cluster(cluster_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Starting cluster: {cluster_id}")
+    logger.info("Starting cluster: %s", cluster_id)
     return await make_api_request("POST", "/api/2.0/clusters/start", data={"cluster_id": cluster_id})
 
 
@@ -107,7 +107,7 @@ async def resize_cluster(cluster_id: str, num_workers: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Resizing cluster {cluster_id} to {num_workers} workers")
+    logger.info("Resizing cluster %s to %s workers", cluster_id, num_workers)
     return await make_api_request(
         "POST",
         "/api/2.0/clusters/resize",
@@ -128,5 +128,5 @@ async def restart_cluster(cluster_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Restarting cluster: {cluster_id}")
+    logger.info("Restarting cluster: %s", cluster_id)
     return await make_api_request("POST", "/api/2.0/clusters/restart", data={"cluster_id": cluster_id})
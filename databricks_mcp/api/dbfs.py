@@ -32,7 +32,7 @@ async def put_file(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Uploading file to DBFS path: {dbfs_path}")
+    logger.info("Uploading file to DBFS path: %s", dbfs_path)
     
     # Convert bytes to base64
     content_base64 = base64.b64encode(file_content).decode("utf-8")
@@ -70,7 +70,7 @@ async def upload_large_file(
         DatabricksAPIError: If the API request fails
         FileNotFoundError: If the local file does not exist
     """
-    logger.info(f"Uploading large file from {local_file_path} to DBFS path: {dbfs_path}")
+    logger.info("Uploading large file from %s to DBFS path: %s", local_file_path, dbfs_path)
     
     if not os.path.exists(local_file_path):
         raise FileNotFoundError(f"Local file not found: {local_file_path}")
@@ -109,7 +109,7 @@ async def upload_large_file(
                 )
                 
                 chunk_index += 1
-                logger.debug(f"Uploaded chunk {chunk_index}")
+                logger.debug("Uploaded chunk %s", chunk_index)
         
         # Close the handle
         return await make_api_request(
@@ -129,7 +129,7 @@ async def upload_large_file(
         except Exception:
             pass
         
-        logger.error(f"Error uploading file: {str(e)}")
+        logger.error("Error uploading file: %s", e)
         raise
 
 
@@ -152,7 +152,7 @@ async def get_file(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Reading file from DBFS path: {dbfs_path}")
+    logger.info("Reading file from DBFS path: %s", dbfs_path)
     
     response = await make_api_request(
         "GET",
@@ -169,7 +169,7 @@ async def get_file(
         try:
             response["decoded_data"] = base64.b64decode(response["data"])
         except Exception as e:
-            logger.warning(f"Failed to decode file content: {str(e)}")
+            logger.warning("Failed to decode file content: %s", e)
             
     return response
 
@@ -187,7 +187,7 @@ async def list_files(dbfs_path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Listing files in DBFS path: {dbfs_path}")
+    logger.info("Listing files in DBFS path: %s", dbfs_path)
     return await make_api_request("GET", "/api/2.0/dbfs/list", params={"path": dbfs_path})
 
 
@@ -208,7 +208,7 @@ async def delete_file(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting DBFS path: {dbfs_path}")
+    logger.info("Deleting DBFS path: %s", dbfs_path)
     return await make_api_request(
         "POST",
         "/api/2.0/dbfs/delete",
@@ -232,7 +232,7 @@ async def get_status(dbfs_path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting status of DBFS path: {dbfs_path}")
+    logger.info("Getting status of DBFS path: %s", dbfs_path)
     return await make_api_request("GET", "/api/2.0/dbfs/get-status", params={"path": dbfs_path})
 
 
@@ -249,5 +249,5 @@ async def create_directory(dbfs_path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating DBFS directory: {dbfs_path}")
+    logger.info("Creating DBFS directory: %s", dbfs_path)
     return await make_api_request("POST", "/api/2.0/dbfs/mkdirs", data={"path": dbfs_path})
@@ -6,21 +6,35 @@ Provides natural language data analysis through Genie AI conversations.
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from databricks_mcp.core.utils import make_api_request, DatabricksAPIError
+from databricks_mcp.core.utils import make_api_request, DatabricksAPIError, async_ttl_cache, singleflight
 
 logger = logging.getLogger(__name__)
 
 # Constants
-GENIE_POLL_INTERVAL = 2  # Seconds between status polls
+GENIE_POLL_INITIAL = 0.5  # Seconds before the first status poll
+GENIE_POLL_MAX = 10  # Upper bound on the delay between status polls
+GENIE_POLL_MULT = 1.5  # Backoff multiplier applied after each poll
 GENIE_MAX_WAIT = 300  # Maximum seconds to wait for response
+GENIE_TOOL_MAX_WAIT = 20  # Seconds an MCP tool call waits before handing back the message id
 
+# Endpoint templates, filled with %-formatting on each call
+_TMPL_START_CONVERSATION = "/api/2.0/genie/spaces/%s/start-conversation"
+_TMPL_MESSAGES = "/api/2.0/genie/spaces/%s/conversations/%s/messages"
+_TMPL_MESSAGE = _TMPL_MESSAGES + "/%s"
+_TMPL_QUERY_RESULT = _TMPL_MESSAGE + "/query-result/%s"
 
+
+@async_ttl_cache(ttl=10)
 async def list_genie_spaces() -> Dict[str, Any]:
     """
     List all available Genie spaces in the workspace.
 
+    Results are cached briefly; spaces are not created through this server.
+
     Returns:
         Response containing list of Genie spaces
 
@@ -34,7 +48,9 @@ async def list_genie_spaces() -> Dict[str, Any]:
 async def start_conversation(
     space_id: str,
     question: str,
-    wait_for_result: bool = True
+    wait_for_result: bool = True,
+    include_raw_attachments: bool = False,
+    max_wait: float = GENIE_MAX_WAIT,
 ) -> Dict[str, Any]:
     """
     Start a new conversation with Genie AI.
@@ -47,21 +63,23 @@ async def start_conversation(
         space_id: Genie space ID to use
         question: Natural language question to ask
         wait_for_result: If True, poll until result is ready. If False, return immediately.
+        include_raw_attachments: If True, return full attachments instead of id/type summaries
+        max_wait: Maximum seconds to wait for the result before returning the
+            pending message, which can then be polled with get_message_status
 
     Returns:
         Response containing conversation_id, message_id, and optionally results
 
     Raises:
         DatabricksAPIError: If the API request fails
-        TimeoutError: If wait_for_result=True and response takes too long
     """
-    logger.info(f"Starting Genie conversation in space {space_id}")
+    logger.info("Starting Genie conversation in space %s", space_id)
 
     # Start conversation
     payload = {"content": question}
     response = await make_api_request(
         "POST",
-        f"/api/2.0/genie/spaces/{space_id}/start-conversation",
+        _TMPL_START_CONVERSATION % (space_id,),
         data=payload
     )
 
@@ -73,22 +91,21 @@ async def start_conversation(
 
     # If not waiting, return immediately
     if not wait_for_result:
-        return {
-            "conversation_id": conversation_id,
-            "message_id": message_id,
-            "status": "PENDING",
-            "question": question
-        }
+        return _pending_message(conversation_id, message_id, question)
 
     # Poll for completion
-    return await _poll_for_message_completion(space_id, conversation_id, message_id, question)
+    return await _wait_for_message(
+        space_id, conversation_id, message_id, question, max_wait, include_raw_attachments
+    )
 
 
 async def send_followup_message(
     space_id: str,
     conversation_id: str,
     question: str,
-    wait_for_result: bool = True
+    wait_for_result: bool = True,
+    include_raw_attachments: bool = False,
+    max_wait: float = GENIE_MAX_WAIT,
 ) -> Dict[str, Any]:
     """
     Send a follow-up message in an existing Genie conversation.
@@ -101,21 +118,23 @@ async def send_followup_message(
         conversation_id: Conversation ID from previous interaction
         question: Follow-up question
         wait_for_result: If True, poll until result is ready
+        include_raw_attachments: If True, return full attachments instead of id/type summaries
+        max_wait: Maximum seconds to wait for the result before returning the
+            pending message, which can then be polled with get_message_status
 
     Returns:
         Response containing message_id and optionally results
 
     Raises:
         DatabricksAPIError: If the API request fails
-        TimeoutError: If wait_for_result=True and response takes too long
     """
-    logger.info(f"Sending Genie follow-up in conversation {conversation_id}")
+    logger.info("Sending Genie follow-up in conversation %s", conversation_id)
 
     # Send follow-up message
     payload = {"content": question}
     response = await make_api_request(
         "POST",
-        f"/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages",
+        _TMPL_MESSAGES % (space_id, conversation_id),
         data=payload
     )
 
@@ -126,17 +145,51 @@ async def send_followup_message(
 
     # If not waiting, return immediately
     if not wait_for_result:
-        return {
-            "conversation_id": conversation_id,
-            "message_id": message_id,
-            "status": "PENDING",
-            "question": question
-        }
+        return _pending_message(conversation_id, message_id, question)
 
     # Poll for completion
-    return await _poll_for_message_completion(space_id, conversation_id, message_id, question)
+    return await _wait_for_message(
+        space_id, conversation_id, message_id, question, max_wait, include_raw_attachments
+    )
+
+
+def _pending_message(conversation_id: str, message_id: str, question: str) -> Dict[str, Any]:
+    """Build the response for a message whose result is not ready yet."""
+    return {
+        "conversation_id": conversation_id,
+        "message_id": message_id,
+        "status": "PENDING",
+        "question": question
+    }
 
 
+async def _wait_for_message(
+    space_id: str,
+    conversation_id: str,
+    message_id: str,
+    question: str,
+    max_wait: float,
+    include_raw_attachments: bool,
+) -> Dict[str, Any]:
+    """
+    Poll for a message's result, falling back to the pending message on timeout.
+
+    Long-running questions would otherwise hold the caller (and the MCP
+    client's request) open; the returned ids let it poll later instead.
+    """
+    try:
+        return await _poll_for_message_completion(
+            space_id, conversation_id, message_id, question,
+            max_wait=max_wait, include_raw_attachments=include_raw_attachments,
+        )
+    except TimeoutError:
+        logger.info("Genie message %s still running after %ss", message_id, max_wait)
+        response = _pending_message(conversation_id, message_id, question)
+        response["hint"] = "Still running; poll get_genie_message_status with these ids"
+        return response
+
+
+@singleflight()
 async def get_message_status(
     space_id: str,
     conversation_id: str,
@@ -156,13 +209,46 @@ async def get_message_status(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting Genie message status: {message_id}")
+    logger.info("Getting Genie message status: %s", message_id)
     return await make_api_request(
         "GET",
-        f"/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages/{message_id}"
+        _TMPL_MESSAGE % (space_id, conversation_id, message_id)
     )
 
 
+async def get_messages_status(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Get the status of several Genie messages concurrently.
+
+    Args:
+        messages: Dicts with space_id, conversation_id and message_id keys
+
+    Returns:
+        Response mapping each message_id to its status response, or to an
+        {"error": message} dict if that lookup failed
+
+    Raises:
+        ValueError: If no messages are given
+        KeyError: If a message is missing one of the required keys
+    """
+    if not messages:
+        raise ValueError("messages must contain at least one message")
+    logger.info("Getting Genie message status for %d messages", len(messages))
+    keys = [(m["space_id"], m["conversation_id"], m["message_id"]) for m in messages]
+    responses = await asyncio.gather(
+        *[get_message_status(*key) for key in keys],
+        return_exceptions=True,
+    )
+    return {
+        "messages": {
+            # BaseException: a cancelled lookup comes back as a (message-less) CancelledError
+            key[2]: {"error": str(response) or type(response).__name__}
+            if isinstance(response, BaseException) else response
+            for key, response in zip(keys, responses)
+        }
+    }
+
+
 async def get_query_results(
     space_id: str,
     conversation_id: str,
@@ -184,29 +270,265 @@ async def get_query_results(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting Genie query results for attachment {attachment_id}")
+    logger.info("Getting Genie query results for attachment %s", attachment_id)
     return await make_api_request(
         "GET",
-        f"/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages/{message_id}/query-result/{attachment_id}"
+        _TMPL_QUERY_RESULT % (space_id, conversation_id, message_id, attachment_id)
     )
 
 
+# Statuses for which a message is still being worked on
+GENIE_PENDING_STATUSES = ("PENDING", "EXECUTING_QUERY")
+
+
+# Messages due within this many seconds of a tick are polled with it
+GENIE_POLL_COALESCE = 0.25
+
+
+class _PendingMessage:
+    """Poll state for one message registered with a GeniePollHub."""
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        deadline: float,
+        max_wait: float,
+        delay: float,
+        max_delay: float,
+        next_poll: float,
+    ):
+        self.future = future
+        self.deadline = deadline
+        self.max_wait = max_wait
+        self.delay = delay
+        self.max_delay = max_delay
+        self.next_poll = next_poll
+        self.waiters = 0
+
+
+class GeniePollHub:
+    """
+    Shared poll loop for outstanding Genie messages.
+
+    Every message being waited on is registered with the hub, and a single
+    background task polls all messages that are due on each tick. Each message
+    backs off on its own schedule, so concurrent questions share one timer
+    instead of each running its own loop, and repeated waits on the same
+    message share one future.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = GENIE_POLL_INITIAL,
+        max_poll_interval: float = GENIE_POLL_MAX,
+    ):
+        """
+        Args:
+            poll_interval: Default initial seconds between polls of a message
+            max_poll_interval: Default maximum seconds between polls of a message
+        """
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._pending: Dict[Tuple[str, str, str], _PendingMessage] = {}
+        self._now = 0.0
+        self._wake: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _clock(self) -> float:
+        # Never behind the time the last tick slept until
+        self._now = max(self._now, time.monotonic())
+        return self._now
+
+    async def wait(
+        self,
+        space_id: str,
+        conversation_id: str,
+        message_id: str,
+        max_wait: float = GENIE_MAX_WAIT,
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait until a message leaves the pending statuses.
+
+        Args:
+            space_id: Genie space ID
+            conversation_id: Conversation ID
+            message_id: Message ID to poll
+            max_wait: Maximum seconds to wait
+            poll_interval: Initial seconds between polls, defaults to the hub's
+            max_poll_interval: Maximum seconds between polls, defaults to the hub's
+
+        Returns:
+            The first status response with a non-pending status
+
+        Raises:
+            TimeoutError: If the message is still pending after max_wait
+            DatabricksAPIError: If a status request fails
+        """
+        key = (space_id, conversation_id, message_id)
+        future = self.register(
+            space_id, conversation_id, message_id, max_wait, poll_interval, max_poll_interval
+        )
+        try:
+            # Shielded so that one waiter giving up does not fail the others
+            return await asyncio.wait_for(asyncio.shield(future), timeout=max_wait)
+        except asyncio.TimeoutError:
+            if future.done():
+                raise
+            raise TimeoutError(
+                f"Genie response timed out after {max_wait} seconds. "
+                f"You can check status later with conversation_id={conversation_id}, message_id={message_id}"
+            ) from None
+        finally:
+            self.release(key, future)
+
+    def register(
+        self,
+        space_id: str,
+        conversation_id: str,
+        message_id: str,
+        max_wait: float = GENIE_MAX_WAIT,
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Register a waiter for a message and return the future resolving with its final status.
+
+        A message that is already registered keeps its future; its deadline is
+        extended to cover max_wait and it is polled at least as often as asked.
+        Each call must be paired with release() once the caller stops waiting.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures from a previous event loop can never be resolved
+            self._pending.clear()
+            self._task = None
+            self._wake = None
+            self._loop = loop
+
+        poll_interval = self.poll_interval if poll_interval is None else poll_interval
+        max_poll_interval = self.max_poll_interval if max_poll_interval is None else max_poll_interval
+        now = self._clock()
+        deadline = time.monotonic() + max_wait
+
+        key = (space_id, conversation_id, message_id)
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = _PendingMessage(
+                loop.create_future(), deadline, max_wait, poll_interval, max_poll_interval, now + poll_interval
+            )
+            self._pending[key] = entry
+        else:
+            if deadline > entry.deadline:
+                entry.deadline, entry.max_wait = deadline, max_wait
+            entry.max_delay = min(entry.max_delay, max_poll_interval)
+            if now + poll_interval < entry.next_poll:
+                # New work polls promptly instead of inheriting a long backoff
+                entry.delay, entry.next_poll = poll_interval, now + poll_interval
+        entry.waiters += 1
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        elif self._wake is not None and entry.next_poll < self._wake:
+            # The loop is sleeping past this message's first poll; restart it
+            self._task.cancel()
+            self._wake = None
+            self._task = loop.create_task(self._run())
+        return entry.future
+
+    def release(self, key: Tuple[str, str, str], future: asyncio.Future) -> None:
+        """Drop one waiter for a message, forgetting the message once nobody waits on it."""
+        entry = self._pending.get(key)
+        if entry is None or entry.future is not future:
+            return
+        entry.waiters -= 1
+        if entry.waiters <= 0:
+            del self._pending[key]
+            future.cancel()
+            if not self._pending and self._wake is not None:
+                # Nothing left to poll; stop the sleeping loop now
+                self._task.cancel()
+                self._task, self._wake = None, None
+
+    async def _run(self) -> None:
+        """Poll all registered messages until none are left."""
+        while self._pending:
+            now = self._clock()
+            delay = max(0.0, min(entry.next_poll for entry in self._pending.values()) - now)
+            delay += random.uniform(0, delay * 0.1)
+            self._wake = now + delay
+            await asyncio.sleep(delay)
+            self._wake = None
+            self._now += delay
+            now = self._clock()
+
+            keys = [key for key, entry in self._pending.items() if entry.next_poll <= now + GENIE_POLL_COALESCE]
+            responses = await asyncio.gather(
+                *[get_message_status(*key) for key in keys],
+                return_exceptions=True,
+            )
+
+            now = self._clock()
+            for key, response in zip(keys, responses):
+                entry = self._pending.get(key)
+                if entry is None:
+                    # Every waiter gave up while the poll was in flight
+                    continue
+                future = entry.future
+                if future.done():
+                    del self._pending[key]
+                elif isinstance(response, BaseException):
+                    future.set_exception(response)
+                    del self._pending[key]
+                elif response.get("status", "UNKNOWN") not in GENIE_PENDING_STATUSES:
+                    future.set_result(response)
+                    del self._pending[key]
+                elif time.monotonic() > entry.deadline:
+                    _, conversation_id, message_id = key
+                    future.set_exception(TimeoutError(
+                        f"Genie response timed out after {entry.max_wait} seconds. "
+                        f"You can check status later with conversation_id={conversation_id}, message_id={message_id}"
+                    ))
+                    del self._pending[key]
+                else:
+                    entry.delay = min(entry.delay * GENIE_POLL_MULT, entry.max_delay)
+                    entry.next_poll = now + entry.delay
+
+
+# Process-wide hub used by start_conversation and send_followup_message
+_poll_hub = GeniePollHub()
+
+
 async def _poll_for_message_completion(
     space_id: str,
     conversation_id: str,
     message_id: str,
     question: str,
-    max_wait: int = GENIE_MAX_WAIT
+    max_wait: float = GENIE_MAX_WAIT,
+    include_raw_attachments: bool = False,
+    poll_interval: Optional[float] = None,
+    max_poll_interval: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Poll for Genie message completion.
 
+    Polling is done by the shared GeniePollHub. The delay between polls of
+    this message starts at ``poll_interval`` and grows by ``GENIE_POLL_MULT``
+    (plus a little jitter) up to ``max_poll_interval``; both default to the
+    hub's ``GENIE_POLL_INITIAL`` and ``GENIE_POLL_MAX``.
+
     Args:
         space_id: Genie space ID
         conversation_id: Conversation ID
         message_id: Message ID to poll
         question: Original question asked
         max_wait: Maximum seconds to wait
+        include_raw_attachments: If True, return full attachments. Otherwise each
+            attachment is reduced to its id and type, since its SQL is already in "sql".
+        poll_interval: Initial seconds between status polls
+        max_poll_interval: Maximum seconds between status polls
 
     Returns:
         Response containing results
@@ -215,66 +537,58 @@ async def _poll_for_message_completion(
         TimeoutError: If polling exceeds max_wait
         DatabricksAPIError: If the API request fails
     """
-    import time
-
-    start_time = time.time()
-    status = "PENDING"
+    status_response = await _poll_hub.wait(
+        space_id, conversation_id, message_id, max_wait, poll_interval, max_poll_interval
+    )
+    status = status_response.get("status", "UNKNOWN")
+
+    if status == "COMPLETED":
+        # Extract results
+        attachments = status_response.get("attachments", [])
+        sql = None
+        results = None
+
+        for attachment in attachments:
+            if attachment.get("query"):
+                sql = attachment["query"].get("query")
+
+        # Fetch all attachment results concurrently
+        attachment_ids = [a["id"] for a in attachments if a.get("id")]
+        query_results = await asyncio.gather(
+            *[
+                get_query_results(space_id, conversation_id, message_id, attachment_id)
+                for attachment_id in attachment_ids
+            ],
+            return_exceptions=True,
+        )
+
+        for query_result in query_results:
+            if isinstance(query_result, Exception):
+                logger.warning("Failed to fetch query results: %s", query_result)
+            elif query_result.get("data_array"):
+                results = query_result
 
-    while status in ["PENDING", "EXECUTING_QUERY"]:
-        # Check timeout
-        if time.time() - start_time > max_wait:
-            raise TimeoutError(
-                f"Genie response timed out after {max_wait} seconds. "
-                f"You can check status later with conversation_id={conversation_id}, message_id={message_id}"
-            )
+        return {
+            "conversation_id": conversation_id,
+            "message_id": message_id,
+            "status": "COMPLETED",
+            "question": question,
+            "sql": sql,
+            "results": results,
+            "response": status_response.get("text", ""),
+            "attachments": attachments if include_raw_attachments else [
+                {"id": a.get("id"), "type": a.get("type")} for a in attachments
+            ],
+        }
 
-        # Wait before polling
-        await asyncio.sleep(GENIE_POLL_INTERVAL)
-
-        # Get message status
-        status_response = await get_message_status(space_id, conversation_id, message_id)
-        status = status_response.get("status", "UNKNOWN")
-
-        if status == "COMPLETED":
-            # Extract results
-            attachments = status_response.get("attachments", [])
-            sql = None
-            results = None
-
-            for attachment in attachments:
-                if attachment.get("query"):
-                    sql = attachment["query"].get("query")
-
-                attachment_id = attachment.get("id")
-                if attachment_id:
-                    try:
-                        query_result = await get_query_results(
-                            space_id, conversation_id, message_id, attachment_id
-                        )
-                        if query_result.get("data_array"):
-                            results = query_result
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch query results: {e}")
-
-            return {
-                "conversation_id": conversation_id,
-                "message_id": message_id,
-                "status": "COMPLETED",
-                "question": question,
-                "sql": sql,
-                "results": results,
-                "response": status_response.get("text", ""),
-                "attachments": attachments
-            }
-
-        elif status in ["FAILED", "CANCELLED"]:
-            error_message = status_response.get("error", {}).get("message", "Unknown error")
-            raise DatabricksAPIError(
-                f"Genie message failed: {error_message}",
-                response=status_response
-            )
+    if status in ["FAILED", "CANCELLED"]:
+        error_message = status_response.get("error", {}).get("message", "Unknown error")
+        raise DatabricksAPIError(
+            f"Genie message failed: {error_message}",
+            response=status_response
+        )
 
-    # If we exit loop without completion, return current status
+    # Any other status means the message did not complete
     return {
         "conversation_id": conversation_id,
         "message_id": message_id,
@@ -4,17 +4,32 @@ API for managing Databricks jobs.
 
 import logging
 import asyncio
+import random
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from databricks_mcp.core.models import Job
-from databricks_mcp.core.utils import DatabricksAPIError, make_api_request
+from databricks_mcp.api.libraries import list_cluster_libraries
+from databricks_mcp.core.models import RunStateView
+from databricks_mcp.core.utils import DatabricksAPIError, async_ttl_cache, make_api_request, singleflight
+
+if TYPE_CHECKING:
+    from databricks_mcp.core.models import Job
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Backoff multiplier applied between run status polls
+POLL_BACKOFF_MULTIPLIER = 1.5
+
+# The runs/get endpoint has no server-side wait, so the client-side backoff is
+# capped at the same cadence the Databricks SQL connector uses for heartbeats.
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 25
+
+# Life cycle states a run never leaves
+TERMINAL_STATES = frozenset({"TERMINATED", "INTERNAL_ERROR", "SKIPPED"})
 
-async def create_job(job_config: Union[Job, Dict[str, Any]]) -> Dict[str, Any]:
+
+async def create_job(job_config: Union["Job", Dict[str, Any]]) -> Dict[str, Any]:
     """
     Create a new Databricks job.
     
@@ -29,12 +44,15 @@ async def create_job(job_config: Union[Job, Dict[str, Any]]) -> Dict[str, Any]:
     """
     logger.info("Creating new job")
 
-    if isinstance(job_config, Job):
-        payload = job_config.model_dump(exclude_none=True)
-    else:
+    # Tool calls pass plain dicts; only Job models need dumping
+    if isinstance(job_config, dict):
         payload = job_config
+    else:
+        payload = job_config.model_dump(exclude_none=True, mode="json")
 
-    return await make_api_request("POST", "/api/2.2/jobs/create", data=payload)
+    result = await make_api_request("POST", "/api/2.2/jobs/create", data=payload)
+    list_jobs.cache_clear()
+    return result
 
 
 async def run_job(job_id: int, notebook_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -51,7 +69,7 @@ async def run_job(job_id: int, notebook_params: Optional[Dict[str, Any]] = None)
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Running job: {job_id}")
+    logger.info("Running job: %s", job_id)
     
     run_params = {"job_id": job_id}
     if notebook_params:
@@ -60,9 +78,12 @@ async def run_job(job_id: int, notebook_params: Optional[Dict[str, Any]] = None)
     return await make_api_request("POST", "/api/2.0/jobs/run-now", data=run_params)
 
 
+@async_ttl_cache(ttl=10)
 async def list_jobs() -> Dict[str, Any]:
     """
     List all jobs.
+
+    Results are cached briefly and invalidated by job mutations.
     
     Returns:
         Response containing a list of jobs
@@ -87,7 +108,7 @@ async def get_job(job_id: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting information for job: {job_id}")
+    logger.info("Getting information for job: %s", job_id)
     return await make_api_request("GET", "/api/2.0/jobs/get", params={"job_id": job_id})
 
 
@@ -105,14 +126,16 @@ async def update_job(job_id: int, new_settings: Dict[str, Any]) -> Dict[str, Any
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating job: {job_id}")
+    logger.info("Updating job: %s", job_id)
     
     update_data = {
         "job_id": job_id,
         "new_settings": new_settings
     }
     
-    return await make_api_request("POST", "/api/2.0/jobs/update", data=update_data)
+    result = await make_api_request("POST", "/api/2.0/jobs/update", data=update_data)
+    list_jobs.cache_clear()
+    return result
 
 
 async def delete_job(job_id: int) -> Dict[str, Any]:
@@ -128,16 +151,21 @@ async def delete_job(job_id: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting job: {job_id}")
-    return await make_api_request("POST", "/api/2.2/jobs/delete", data={"job_id": job_id})
+    logger.info("Deleting job: %s", job_id)
+    result = await make_api_request("POST", "/api/2.2/jobs/delete", data={"job_id": job_id})
+    list_jobs.cache_clear()
+    return result
 
 
-async def get_run(run_id: int) -> Dict[str, Any]:
+async def get_run(run_id: int, fields: Optional[str] = None) -> Dict[str, Any]:
     """
     Get information about a specific job run.
     
     Args:
         run_id: ID of the run
+        fields: Optional comma-separated top-level keys to keep, e.g. "state".
+            The runs/get endpoint has no server-side projection, so the full
+            run is fetched; "state" alone is decoded through RunStateView.
         
     Returns:
         Response containing run information
@@ -145,8 +173,16 @@ async def get_run(run_id: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting information for run: {run_id}")
-    return await make_api_request("GET", "/api/2.1/jobs/runs/get", params={"run_id": run_id})
+    keys = [key.strip() for key in fields.split(",") if key.strip()] if fields else []
+    if keys == ["state"]:
+        response = await _get_run_state(run_id)
+    else:
+        logger.info("Getting information for run: %s", run_id)
+        response = await make_api_request("GET", "/api/2.1/jobs/runs/get", params={"run_id": run_id})
+    if keys:
+        # The state view only projects when msgspec is installed
+        response = {key: response[key] for key in keys if key in response}
+    return response
 
 
 async def list_runs(job_id: Optional[int] = None, limit: int = 20) -> Dict[str, Any]:
@@ -158,9 +194,23 @@ async def list_runs(job_id: Optional[int] = None, limit: int = 20) -> Dict[str,
     return await make_api_request("GET", "/api/2.1/jobs/runs/list", params=params)
 
 
+@singleflight()
+async def _get_run_state(run_id: int) -> Dict[str, Any]:
+    """Fetch a run, decoding only its state when msgspec is available."""
+    return await make_api_request(
+        "GET", "/api/2.1/jobs/runs/get", params={"run_id": run_id}, response_type=RunStateView
+    )
+
+
+async def get_run_lifecycle(run_id: int) -> Optional[str]:
+    """Get only the life cycle state of a run, e.g. "RUNNING" or "TERMINATED"."""
+    info = await get_run(run_id, fields="state")
+    return info.get("state", {}).get("life_cycle_state")
+
+
 async def get_run_status(run_id: int) -> Dict[str, Any]:
     """Get concise status information for a run."""
-    info = await get_run(run_id)
+    info = await get_run(run_id, fields="state")
     state = info.get("state", {})
     return {
         "state": state.get("result_state") or state.get("life_cycle_state"),
@@ -182,7 +232,7 @@ async def cancel_run(run_id: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Cancelling run: {run_id}")
+    logger.info("Cancelling run: %s", run_id)
     return await make_api_request("POST", "/api/2.1/jobs/runs/cancel", data={"run_id": run_id})
 
 
@@ -201,7 +251,7 @@ async def submit_run(run_config: Dict[str, Any]) -> Dict[str, Any]:
 
 async def get_run_output(run_id: int) -> Dict[str, Any]:
     """Get the output of a run."""
-    logger.info(f"Fetching output for run {run_id}")
+    logger.info("Fetching output for run %s", run_id)
     return await make_api_request("GET", "/api/2.0/jobs/runs/get-output", params={"run_id": run_id})
 
 
@@ -209,28 +259,37 @@ async def await_until_state(
     run_id: int,
     desired_state: str = "TERMINATED",
     timeout_seconds: int = 600,
-    poll_interval_seconds: int = 5,
+    poll_interval_seconds: float = 1,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
 ) -> Dict[str, Any]:
-    """Wait for a run to reach a desired state."""
+    """Wait for a run to reach a desired state.
+
+    Polls with exponential backoff: the delay starts at ``poll_interval_seconds``
+    and grows by ``POLL_BACKOFF_MULTIPLIER`` (plus jitter) up to
+    ``max_poll_interval_seconds``. Only the run state is fetched on each poll,
+    and the last state response is returned; use get_run for the full run.
+    """
     start = time.monotonic()
+    delay = poll_interval_seconds
     while True:
-        run_info = await get_run(run_id)
+        run_info = await get_run(run_id, fields="state")
         state = run_info.get("state", {}).get("life_cycle_state")
         if state == desired_state:
             return run_info
+        if state in TERMINAL_STATES:
+            raise DatabricksAPIError(f"Run {run_id} entered terminal state {state}", response=run_info)
         if time.monotonic() - start > timeout_seconds:
             raise TimeoutError(f"Run {run_id} did not reach state {desired_state} within {timeout_seconds}s")
-        await asyncio.sleep(poll_interval_seconds)
+        await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = min(delay * POLL_BACKOFF_MULTIPLIER, max_poll_interval_seconds)
 
 
-async def run_notebook(
+def _notebook_run_config(
     notebook_path: str,
     existing_cluster_id: Optional[str] = None,
     base_parameters: Optional[Dict[str, Any]] = None,
-    timeout_seconds: int = 600,
-    poll_interval_seconds: int = 5,
 ) -> Dict[str, Any]:
-    """Submit a one-time run for a notebook and wait for completion."""
+    """Build the one-time run configuration for a notebook task."""
     task = {
         "task_key": "run_notebook",
         "notebook_task": {"notebook_path": notebook_path},
@@ -240,13 +299,77 @@ async def run_notebook(
     if existing_cluster_id:
         task["existing_cluster_id"] = existing_cluster_id
 
-    run_conf = {"tasks": [task]}
-    submit_response = await submit_run(run_conf)
+    return {"tasks": [task]}
+
+
+async def _wait_for_run_output(
+    submit_response: Dict[str, Any],
+    timeout_seconds: int,
+    poll_interval_seconds: float,
+    max_poll_interval_seconds: float,
+) -> Dict[str, Any]:
+    """Wait for a submitted run to terminate and return its output."""
     run_id = submit_response.get("run_id")
     if not run_id:
         raise ValueError("submit_run did not return a run_id")
 
-    await await_until_state(run_id, timeout_seconds=timeout_seconds, poll_interval_seconds=poll_interval_seconds)
+    await await_until_state(
+        run_id,
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+    )
     output = await get_run_output(run_id)
     output["run_id"] = run_id
     return output
+
+
+async def run_notebook(
+    notebook_path: str,
+    existing_cluster_id: Optional[str] = None,
+    base_parameters: Optional[Dict[str, Any]] = None,
+    timeout_seconds: int = 600,
+    poll_interval_seconds: float = 1,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+) -> Dict[str, Any]:
+    """Submit a one-time run for a notebook and wait for completion."""
+    run_conf = _notebook_run_config(notebook_path, existing_cluster_id, base_parameters)
+    submit_response = await submit_run(run_conf)
+    return await _wait_for_run_output(
+        submit_response, timeout_seconds, poll_interval_seconds, max_poll_interval_seconds
+    )
+
+
+async def run_notebook_with_context(
+    notebook_path: str,
+    existing_cluster_id: Optional[str] = None,
+    base_parameters: Optional[Dict[str, Any]] = None,
+    timeout_seconds: int = 600,
+    poll_interval_seconds: float = 1,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+) -> Dict[str, Any]:
+    """Run a notebook like run_notebook, also returning the cluster's library status.
+
+    The run submission and the library status lookup are issued concurrently.
+    The library status is included under "libraries" when existing_cluster_id is set.
+    The lookup is best-effort: once the run is submitted, a failed lookup is
+    reported as an {"error": message} dict so the run_id is never lost.
+    """
+    run_conf = _notebook_run_config(notebook_path, existing_cluster_id, base_parameters)
+    if existing_cluster_id:
+        submit_response, cluster_libraries = await asyncio.gather(
+            submit_run(run_conf), list_cluster_libraries(existing_cluster_id), return_exceptions=True
+        )
+        if isinstance(submit_response, BaseException):
+            raise submit_response
+        if isinstance(cluster_libraries, BaseException):
+            cluster_libraries = {"error": str(cluster_libraries) or type(cluster_libraries).__name__}
+    else:
+        submit_response, cluster_libraries = await submit_run(run_conf), None
+
+    output = await _wait_for_run_output(
+        submit_response, timeout_seconds, poll_interval_seconds, max_poll_interval_seconds
+    )
+    if cluster_libraries is not None:
+        output["libraries"] = cluster_libraries
+    return output
@@ -4,13 +4,17 @@ API for managing Databricks notebooks.
 
 import base64
 import logging
+import re
 from typing import Any, Dict, List, Optional
 
-from databricks_mcp.core.utils import DatabricksAPIError, make_api_request
+from databricks_mcp.core.utils import DatabricksAPIError, json_loads, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Base64 alphabet with optional trailing padding, line breaks removed
+_B64_RE = re.compile(rb"[A-Za-z0-9+/]*={0,2}")
+
 
 async def import_notebook(
     path: str,
@@ -35,7 +39,7 @@ async def import_notebook(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Importing notebook to path: {path}")
+    logger.info("Importing notebook to path: %s", path)
     
     # Ensure content is base64 encoded
     if not is_base64(content):
@@ -57,6 +61,7 @@ async def import_notebook(
 async def export_notebook(
     path: str,
     format: str = "SOURCE",
+    include_raw_content: bool = False,
 ) -> Dict[str, Any]:
     """
     Export a notebook from the workspace.
@@ -64,6 +69,9 @@ async def export_notebook(
     Args:
         path: The path of the notebook to export
         format: The format to export (SOURCE, HTML, JUPYTER, DBC)
+        include_raw_content: Keep the base64 "content" alongside "decoded_content"
+            after a successful decode. Content that is not valid UTF-8 is
+            always returned as "content", without "decoded_content"
         
     Returns:
         Response containing the notebook content
@@ -71,7 +79,7 @@ async def export_notebook(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Exporting notebook from path: {path}")
+    logger.info("Exporting notebook from path: %s", path)
     
     params = {
         "path": path,
@@ -83,9 +91,14 @@ async def export_notebook(
     # Optionally decode base64 content
     if "content" in response and format in ["SOURCE", "JUPYTER"]:
         try:
-            response["decoded_content"] = base64.b64decode(response["content"]).decode("utf-8")
+            raw = _decode_exported_content(response, include_raw_content)
+            response["decoded_content"] = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.warning("Failed to decode notebook content: %s", e)
+            # Not UTF-8 text: hand back the content as exported instead
+            response.setdefault("content", base64.b64encode(raw).decode("ascii"))
         except Exception as e:
-            logger.warning(f"Failed to decode notebook content: {str(e)}")
+            logger.warning("Failed to decode notebook content: %s", e)
             
     return response
 
@@ -103,7 +116,7 @@ async def list_notebooks(path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Listing notebooks in path: {path}")
+    logger.info("Listing notebooks in path: %s", path)
     return await make_api_request("GET", "/api/2.0/workspace/list", params={"path": path})
 
 
@@ -121,7 +134,7 @@ async def delete_notebook(path: str, recursive: bool = False) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting path: {path}")
+    logger.info("Deleting path: %s", path)
     return await make_api_request(
         "POST",
         "/api/2.0/workspace/delete",
@@ -142,13 +155,15 @@ async def create_directory(path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating directory: {path}")
+    logger.info("Creating directory: %s", path)
     return await make_api_request("POST", "/api/2.0/workspace/mkdirs", data={"path": path})
 
 
 async def export_workspace_file(
     path: str,
     format: str = "SOURCE",
+    validate_json: bool = False,
+    include_raw_content: bool = False,
 ) -> Dict[str, Any]:
     """
     Export any file from the workspace (not just notebooks).
@@ -156,6 +171,10 @@ async def export_workspace_file(
     Args:
         path: The workspace path of the file to export (e.g., /Users/user@domain.com/file.json)
         format: The format to export (SOURCE, HTML, JUPYTER, DBC)
+        validate_json: If True, fully parse content before reporting it as JSON
+            instead of sniffing the first character
+        include_raw_content: Keep the base64 "content" alongside "decoded_content"
+            after a successful decode
         
     Returns:
         Response containing the file content
@@ -163,7 +182,7 @@ async def export_workspace_file(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Exporting workspace file from path: {path}")
+    logger.info("Exporting workspace file from path: %s", path)
     
     params = {
         "path": path,
@@ -175,35 +194,71 @@ async def export_workspace_file(
     # Always try to decode base64 content for SOURCE format
     if "content" in response and format == "SOURCE":
         try:
-            decoded_content = base64.b64decode(response["content"]).decode("utf-8")
-            response["decoded_content"] = decoded_content
-            response["content_type"] = "text"
-            
-            # Try to detect if it's JSON
-            try:
-                import json
-                json.loads(decoded_content)  # Validate JSON
-                response["content_type"] = "json"
-            except json.JSONDecodeError:
-                pass  # Keep as text
-                
+            raw = _decode_exported_content(response, include_raw_content)
+        except Exception as e:
+            logger.warning("Failed to decode content with any encoding: %s", e)
+            response["content_type"] = "binary"
+            response["note"] = "Content could not be decoded as text"
+            return response
+
+        try:
+            decoded_content = raw.decode("utf-8")
         except UnicodeDecodeError as e:
-            logger.warning(f"Failed to decode file content as UTF-8: {str(e)}")
-            # Try different encodings
-            try:
-                decoded_bytes = base64.b64decode(response["content"])
-                # Return as text with error replacement
-                response["decoded_content"] = decoded_bytes.decode("utf-8", errors="replace")
-                response["content_type"] = "text"
-                response["encoding_warning"] = "Some characters may not display correctly"
-            except Exception as e2:
-                logger.warning(f"Failed to decode content with any encoding: {str(e2)}")
-                response["content_type"] = "binary"
-                response["note"] = "Content could not be decoded as text"
+            logger.warning("Failed to decode file content as UTF-8: %s", e)
+            # Return as text with error replacement
+            response["decoded_content"] = raw.decode("utf-8", errors="replace")
+            response["content_type"] = "text"
+            response["encoding_warning"] = "Some characters may not display correctly"
+            return response
+
+        response["decoded_content"] = decoded_content
+        response["content_type"] = "json" if _looks_like_json(decoded_content, validate_json) else "text"
     
     return response
 
 
+def _decode_exported_content(response: Dict[str, Any], include_raw_content: bool) -> bytes:
+    """
+    Decode the base64 "content" of an export response.
+
+    Unless the raw content is requested, it is dropped from the response as
+    soon as it has been decoded so the encoded string can be freed before
+    the text is built.
+
+    Args:
+        response: Export API response containing "content"
+        include_raw_content: Whether to keep "content" in the response
+
+    Returns:
+        Decoded bytes
+    """
+    raw = base64.b64decode(response["content"])
+    if not include_raw_content:
+        del response["content"]
+    return raw
+
+
+def _looks_like_json(content: str, validate: bool = False) -> bool:
+    """
+    Detect whether text content is JSON.
+
+    Args:
+        content: Decoded text content
+        validate: If True, parse the content instead of sniffing its first character
+
+    Returns:
+        True if the content appears to be JSON
+    """
+    if validate:
+        try:
+            json_loads(content)
+        except ValueError:
+            return False
+        return True
+    first = content.lstrip()[:1]
+    return first != "" and first in "{["
+
+
 async def get_workspace_file_info(path: str) -> Dict[str, Any]:
     """
     Get information about a workspace file without downloading content.
@@ -217,32 +272,19 @@ async def get_workspace_file_info(path: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting workspace file info for path: {path}")
-    
-    # Use the workspace list API to get file metadata
-    # Split the path to get directory and filename
-    import os
-    directory = os.path.dirname(path)
-    filename = os.path.basename(path)
-    
-    if not directory:
-        directory = "/"
-    
-    # List the directory to find the file
-    response = await make_api_request("GET", "/api/2.0/workspace/list", params={"path": directory})
-    
-    # Find the specific file in the listing
-    if "objects" in response:
-        for obj in response["objects"]:
-            if obj.get("path") == path:
-                return obj
-    
-    raise DatabricksAPIError(f"File not found: {path}")
+    logger.info("Getting workspace file info for path: %s", path)
+    return await make_api_request("GET", "/api/2.0/workspace/get-status", params={"path": path})
 
 
 def is_base64(content: str) -> bool:
     """
     Check if a string is already base64 encoded.
+
+    Uses a single regex pass over the whole content instead of a
+    decode/encode round trip. Line breaks are only accepted as MIME-style
+    wrapping: every line but the last must have the same length, a multiple
+    of 4. Text of base64 characters broken into uneven lines, such as an ID
+    list, is therefore treated as plain text and gets encoded.
     
     Args:
         content: The string to check
@@ -250,7 +292,18 @@ def is_base64(content: str) -> bool:
     Returns:
         True if the string is base64 encoded, False otherwise
     """
-    try:
-        return base64.b64encode(base64.b64decode(content)) == content.encode('utf-8')
-    except Exception:
-        return False 
\ No newline at end of file
+    data = content.encode("ascii", "ignore")
+    if len(data) != len(content):
+        return False
+
+    if b"\n" in data or b"\r" in data:
+        lines = data.splitlines()
+        width = len(lines[0])
+        if width % 4 != 0 or any(len(line) != width for line in lines[1:-1]) or len(lines[-1]) > width:
+            return False
+        data = b"".join(lines)
+
+    if len(data) % 4 != 0:
+        return False
+
+    return _B64_RE.fullmatch(data) is not None
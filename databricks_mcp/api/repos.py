@@ -3,7 +3,7 @@
 import logging
 from typing import Any, Dict, Optional
 
-from databricks_mcp.core.utils import DatabricksAPIError, make_api_request
+from databricks_mcp.core.utils import DatabricksAPIError, async_ttl_cache, make_api_request
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,9 @@ async def create_repo(url: str, provider: str, branch: Optional[str] = None, pat
         payload["branch"] = branch
     if path:
         payload["path"] = path
-    return await make_api_request("POST", "/api/2.0/repos", data=payload)
+    result = await make_api_request("POST", "/api/2.0/repos", data=payload)
+    list_repos.cache_clear()
+    return result
 
 
 async def update_repo(repo_id: int, branch: Optional[str] = None, tag: Optional[str] = None) -> Dict[str, Any]:
@@ -25,11 +27,14 @@ async def update_repo(repo_id: int, branch: Optional[str] = None, tag: Optional[
         payload["branch"] = branch
     if tag:
         payload["tag"] = tag
-    return await make_api_request("PATCH", f"/api/2.0/repos/{repo_id}", data=payload)
+    result = await make_api_request("PATCH", f"/api/2.0/repos/{repo_id}", data=payload)
+    list_repos.cache_clear()
+    return result
 
 
+@async_ttl_cache(ttl=10)
 async def list_repos(path_prefix: Optional[str] = None) -> Dict[str, Any]:
-    """List repos, optionally filtered by path prefix."""
+    """List repos, optionally filtered by path prefix (cached briefly, invalidated by repo changes)."""
     params = {"path_prefix": path_prefix} if path_prefix else None
     return await make_api_request("GET", "/api/2.0/repos", params=params)
 
@@ -46,6 +51,8 @@ async def pull_repo(repo_id: int) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Pulling repo {repo_id}")
+    logger.info("Pulling repo %s", repo_id)
     endpoint = f"/api/2.0/repos/{repo_id}/pull"
-    return await make_api_request("POST", endpoint)
+    result = await make_api_request("POST", endpoint)
+    list_repos.cache_clear()
+    return result
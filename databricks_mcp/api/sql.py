@@ -2,7 +2,9 @@
 API for executing SQL statements on Databricks.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from databricks_mcp.core.utils import DatabricksAPIError, make_api_request
@@ -12,6 +14,20 @@ from databricks_mcp.core.sql_safety import check_sql_safety, SQLSafetyError
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bounds the Statement Execution API accepts for wait_timeout, in seconds
+MIN_SERVER_WAIT_SECONDS = 5
+MAX_SERVER_WAIT_SECONDS = 50
+
+# Upper bound on the client-side delay between statement status polls
+MAX_POLL_INTERVAL_SECONDS = 5
+
+# Request body fields that are the same for every statement submission
+_EXEC_TEMPLATE = {
+    "format": "JSON_ARRAY",
+    "disposition": "INLINE",
+    "byte_limit": 16777216,
+}
+
 
 async def execute_statement(
     statement: str,
@@ -21,6 +37,7 @@ async def execute_statement(
     parameters: Optional[Dict[str, Any]] = None,
     row_limit: int = 10000,
     byte_limit: int = 100000000,  # 100MB
+    wait_timeout: str = "50s",
 ) -> Dict[str, Any]:
     """
     Execute a SQL statement.
@@ -33,6 +50,8 @@ async def execute_statement(
         parameters: Optional statement parameters
         row_limit: Maximum number of rows to return
         byte_limit: Maximum number of bytes to return
+        wait_timeout: How long the server holds the request waiting for a result
+            ("0s" or between "5s" and "50s")
         
     Returns:
         Response containing query results
@@ -41,7 +60,7 @@ async def execute_statement(
         DatabricksAPIError: If the API request fails
         ValueError: If no warehouse_id is provided and DATABRICKS_WAREHOUSE_ID is not set
     """
-    logger.info(f"Executing SQL statement: {statement[:100]}...")
+    logger.info("Executing SQL statement: %s...", statement[:100])
     
     # Use provided warehouse_id or fall back to environment variable
     effective_warehouse_id = warehouse_id or settings.DATABRICKS_WAREHOUSE_ID
@@ -52,14 +71,11 @@ async def execute_statement(
             "set DATABRICKS_WAREHOUSE_ID environment variable"
         )
     
-    request_data = {
+    request_data = _EXEC_TEMPLATE | {
         "statement": statement,
         "warehouse_id": effective_warehouse_id,
-        "wait_timeout": "10s",
-        "format": "JSON_ARRAY",
-        "disposition": "INLINE",
+        "wait_timeout": wait_timeout,
         "row_limit": row_limit,
-        "byte_limit": 16777216,
     }
     
     if catalog:
@@ -81,10 +97,18 @@ async def execute_and_wait(
     schema: Optional[str] = None,
     parameters: Optional[Dict[str, Any]] = None,
     timeout_seconds: int = 300,  # 5 minutes
-    poll_interval_seconds: int = 1,
+    poll_interval_seconds: float = 0.1,
+    server_wait_seconds: int = MAX_SERVER_WAIT_SECONDS,
+    max_poll_interval_seconds: float = MAX_POLL_INTERVAL_SECONDS,
 ) -> Dict[str, Any]:
     """
     Execute a SQL statement and wait for completion.
+
+    The submission asks the server to hold the request for up to
+    ``server_wait_seconds`` (Databricks caps this at 50s) so short queries
+    finish without any client polling.
+    After that the status is polled with a delay that starts at
+    ``poll_interval_seconds`` and doubles up to ``max_poll_interval_seconds``.
     
     Args:
         statement: The SQL statement to execute
@@ -93,7 +117,10 @@ async def execute_and_wait(
         schema: Optional schema to use
         parameters: Optional statement parameters
         timeout_seconds: Maximum time to wait for completion
-        poll_interval_seconds: How often to poll for status
+        poll_interval_seconds: Delay before the first status poll
+        server_wait_seconds: Seconds the server may hold the submit request
+            (clamped to the 5-50s range the API accepts)
+        max_poll_interval_seconds: Upper bound on the delay between polls
         
     Returns:
         Response containing query results
@@ -102,35 +129,42 @@ async def execute_and_wait(
         DatabricksAPIError: If the API request fails
         TimeoutError: If query execution times out
     """
-    import asyncio
-    import time
+    logger.info("Executing SQL statement with waiting: %s...", statement[:100])
     
-    logger.info(f"Executing SQL statement with waiting: {statement[:100]}...")
-    
-    # Start execution
+    # Start execution, letting the server wait for the result first
+    server_wait = min(max(server_wait_seconds, MIN_SERVER_WAIT_SECONDS), MAX_SERVER_WAIT_SECONDS)
     response = await execute_statement(
         statement=statement,
         warehouse_id=warehouse_id,
         catalog=catalog,
         schema=schema,
         parameters=parameters,
+        wait_timeout=f"{server_wait}s",
     )
     
     statement_id = response.get("statement_id")
     if not statement_id:
         raise ValueError("No statement_id returned from execution")
     
-    # Poll for completion
-    start_time = time.time()
+    # The server-side wait usually covers the whole query, leaving nothing to poll
     status = response.get("status", {}).get("state", "")
+    if status == "SUCCEEDED":
+        return response
+    _raise_if_failed(response)
+    
+    # Poll for completion
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    delay = poll_interval_seconds
     
     while status in ["PENDING", "RUNNING"]:
         # Check timeout
-        if time.time() - start_time > timeout_seconds:
+        if loop.time() > deadline:
             raise TimeoutError(f"Query execution timed out after {timeout_seconds} seconds")
         
-        # Wait before polling again
-        await asyncio.sleep(poll_interval_seconds)
+        # Wait before polling again, backing off exponentially
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_poll_interval_seconds)
         
         # Check status
         status_response = await get_statement_status(statement_id)
@@ -138,13 +172,19 @@ async def execute_and_wait(
         
         if status == "SUCCEEDED":
             return status_response
-        elif status in ["FAILED", "CANCELED", "CLOSED"]:
-            error_message = status_response.get("status", {}).get("error", {}).get("message", "Unknown error")
-            raise DatabricksAPIError(f"Query execution failed: {error_message}", response=status_response)
+        _raise_if_failed(status_response)
     
     return response
 
 
+def _raise_if_failed(status_response: Dict[str, Any]) -> None:
+    """Raise DatabricksAPIError if a statement response is in a failed state."""
+    status = status_response.get("status", {})
+    if status.get("state") in ["FAILED", "CANCELED", "CLOSED"]:
+        error_message = status.get("error", {}).get("message", "Unknown error")
+        raise DatabricksAPIError(f"Query execution failed: {error_message}", response=status_response)
+
+
 async def get_statement_status(statement_id: str) -> Dict[str, Any]:
     """
     Get the status of a SQL statement.
@@ -158,8 +198,8 @@ async def get_statement_status(statement_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting status of SQL statement: {statement_id}")
-    return await make_api_request("GET", f"/api/2.0/sql/statements/{statement_id}", params={})
+    logger.info("Getting status of SQL statement: %s", statement_id)
+    return await make_api_request("GET", f"/api/2.0/sql/statements/{statement_id}")
 
 
 async def cancel_statement(statement_id: str) -> Dict[str, Any]:
@@ -175,10 +215,22 @@ async def cancel_statement(statement_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Cancelling SQL statement: {statement_id}")
+    logger.info("Cancelling SQL statement: %s", statement_id)
     return await make_api_request("POST", f"/api/2.0/sql/statements/{statement_id}/cancel", data={})
 
 
+@lru_cache(maxsize=1024)
+def _check_sql_safety_cached(statement: str) -> bool:
+    """
+    Run the strict SQL safety check, remembering statements that passed.
+
+    Agents often repeat the same query, so validated statements skip
+    re-parsing. Rejected statements raise and are not cached.
+    """
+    check_sql_safety(statement, strict_mode=True)
+    return True
+
+
 async def execute_safe_statement(
     statement: str,
     warehouse_id: Optional[str] = None,
@@ -227,7 +279,7 @@ async def execute_safe_statement(
     """
     # Validate SQL safety if requested
     if validate_read_only:
-        check_sql_safety(statement, strict_mode=True)
+        _check_sql_safety_cached(statement)
         logger.info("SQL safety validation passed")
 
     # Execute the statement
@@ -1,15 +1,50 @@
 """API for Unity Catalog."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
 
-from databricks_mcp.core.utils import make_api_request
+from databricks_mcp.core.utils import async_ttl_cache, make_api_request
 from databricks_mcp.api import sql
 
 logger = logging.getLogger(__name__)
 
+# Seconds listings stay cached. Creates and SQL run through this module
+# invalidate them; changes made outside this server stay invisible until the
+# TTL runs out or clear_cache is called
+LISTING_CACHE_TTL = 60
+# Leading keywords of statements that cannot change catalogs, schemas or tables
+_READ_ONLY_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "DESC", "EXPLAIN", "VALUES", "LIST"})
+# Entries kept per listing; list_catalog_tree never walks more schemas than this
+LISTING_CACHE_SIZE = 256
 
+
+# Resource paths for user-supplied (dotted) names, quoted once and cached
+@lru_cache(maxsize=4096)
+def catalog_url(name: str) -> str:
+    return f"/api/2.1/unity-catalog/catalogs/{quote(name, safe='')}"
+
+
+@lru_cache(maxsize=4096)
+def schema_url(full_name: str) -> str:
+    return f"/api/2.1/unity-catalog/schemas/{quote(full_name, safe='.')}"
+
+
+@lru_cache(maxsize=4096)
+def table_url(full_name: str) -> str:
+    return f"/api/2.1/unity-catalog/tables/{quote(full_name, safe='.')}"
+
+
+@lru_cache(maxsize=4096)
+def lineage_url(full_name: str) -> str:
+    return f"/api/2.1/unity-catalog/lineage-tracking/table-lineage/{quote(full_name, safe='.')}"
+
+
+@async_ttl_cache(ttl=LISTING_CACHE_TTL)
 async def list_catalogs() -> Dict[str, Any]:
+    """List catalogs (cached, invalidated by create_catalog)."""
     logger.info("Listing catalogs")
     return await make_api_request("GET", "/api/2.1/unity-catalog/catalogs")
 
@@ -18,10 +53,14 @@ async def create_catalog(name: str, comment: Optional[str] = None) -> Dict[str,
     payload = {"name": name}
     if comment:
         payload["comment"] = comment
-    return await make_api_request("POST", "/api/2.1/unity-catalog/catalogs", data=payload)
+    result = await make_api_request("POST", "/api/2.1/unity-catalog/catalogs", data=payload)
+    list_catalogs.cache_clear()
+    return result
 
 
+@async_ttl_cache(ttl=LISTING_CACHE_TTL, maxsize=LISTING_CACHE_SIZE)
 async def list_schemas(catalog_name: str) -> Dict[str, Any]:
+    """List schemas in a catalog (cached, invalidated by create_schema)."""
     return await make_api_request("GET", "/api/2.1/unity-catalog/schemas", params={"catalog_name": catalog_name})
 
 
@@ -29,19 +68,146 @@ async def create_schema(catalog_name: str, name: str, comment: Optional[str] = N
     payload = {"catalog_name": catalog_name, "name": name}
     if comment:
         payload["comment"] = comment
-    return await make_api_request("POST", "/api/2.1/unity-catalog/schemas", data=payload)
+    result = await make_api_request("POST", "/api/2.1/unity-catalog/schemas", data=payload)
+    list_schemas.invalidate(catalog_name)
+    return result
 
 
+@async_ttl_cache(ttl=LISTING_CACHE_TTL, maxsize=LISTING_CACHE_SIZE)
 async def list_tables(catalog_name: str, schema_name: str) -> Dict[str, Any]:
+    """List tables in a schema (cached, cleared by the DDL helpers)."""
     params = {"catalog_name": catalog_name, "schema_name": schema_name}
     return await make_api_request("GET", "/api/2.1/unity-catalog/tables", params=params)
 
 
 async def create_table(warehouse_id: str, statement: str) -> Dict[str, Any]:
     """Execute a CREATE TABLE statement using the SQL API."""
-    return await sql.execute_statement(statement, warehouse_id=warehouse_id)
-
-
+    result = await sql.execute_statement(statement, warehouse_id=warehouse_id)
+    # The target is only named inside the SQL (which may also create or drop
+    # schemas), so drop every listing
+    _clear_listings()
+    return result
+
+
+def _strip_trailing_comment(statement: str) -> str:
+    """Remove a ``--`` comment from the last line of a statement, ignoring quoted text."""
+    head, sep, last = statement.rpartition("\n")
+    quote = None
+    for i, ch in enumerate(last):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"`":
+            quote = ch
+        elif last.startswith("--", i):
+            return (head + sep + last[:i]).rstrip()
+    return statement
+
+
+async def create_tables_batch(warehouse_id: str, statements: List[str]) -> Dict[str, Any]:
+    """Execute several DDL statements in one SQL API call.
+
+    The statement API runs a single statement per request, so the batch is
+    wrapped in a BEGIN ... END compound statement (SQL scripting). A trailing
+    line comment is dropped from each statement so it cannot swallow the
+    separator.
+
+    Raises:
+        ValueError: If statements is not a list, or no statement is left once
+            blank entries are dropped
+    """
+    if not isinstance(statements, (list, tuple)):
+        raise ValueError("statements must be a list of SQL statements")
+    cleaned = [c for c in (_strip_trailing_comment(s.strip()).rstrip(";").strip() for s in statements) if c]
+    if not cleaned:
+        raise ValueError("statements must contain at least one statement")
+    body = ";\n".join(cleaned)
+    logger.info("Submitting %d DDL statements as one batch", len(cleaned))
+    result = await sql.execute_statement(f"BEGIN\n{body};\nEND", warehouse_id=warehouse_id)
+    _clear_listings()
+    return result
+
+
+async def execute_sql(
+    statement: str,
+    warehouse_id: Optional[str] = None,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Execute a SQL statement, dropping cached listings unless it is a plain read.
+
+    Arbitrary SQL can run DDL such as CREATE SCHEMA or DROP TABLE, so any
+    statement not starting with a read-only keyword clears the listings.
+    """
+    result = await sql.execute_statement(statement, warehouse_id=warehouse_id, catalog=catalog, schema=schema)
+    words = statement.split(None, 1)
+    if not words or words[0].upper() not in _READ_ONLY_KEYWORDS:
+        _clear_listings()
+    return result
+
+
+@async_ttl_cache(ttl=10)
 async def get_table_lineage(full_name: str) -> Dict[str, Any]:
-    endpoint = f"/api/2.1/unity-catalog/lineage-tracking/table-lineage/{full_name}"
-    return await make_api_request("GET", endpoint)
+    """Get lineage for a table (cached briefly; lineage is recorded asynchronously anyway)."""
+    return await make_api_request("GET", lineage_url(full_name))
+
+
+async def list_catalog_tree(max_schemas: int = 100, max_tables: int = 1000) -> Dict[str, Any]:
+    """
+    List every catalog with its schemas and their table names in one call.
+
+    Schemas are listed for all catalogs, then tables for up to max_schemas
+    schemas, each level concurrently and through the cached listings. A
+    catalog or schema that cannot be listed carries an "error" instead.
+
+    Args:
+        max_schemas: Maximum number of schemas whose tables are listed, capped
+            at LISTING_CACHE_SIZE so repeated calls are served from cache
+        max_tables: Maximum number of table names returned per schema
+
+    Returns:
+        {"catalogs": [{"name", "schemas": [{"name", "tables"}]}], "truncated"},
+        where truncated is set if either limit was hit
+    """
+    catalogs = [{"name": c["name"]} for c in (await list_catalogs()).get("catalogs", [])]
+    schema_responses = await asyncio.gather(
+        *[list_schemas(catalog["name"]) for catalog in catalogs], return_exceptions=True
+    )
+
+    schemas = []
+    for catalog, response in zip(catalogs, schema_responses):
+        if isinstance(response, Exception):
+            catalog["error"] = str(response)
+            continue
+        catalog["schemas"] = [{"name": s["name"]} for s in response.get("schemas", [])]
+        schemas.extend((catalog["name"], schema) for schema in catalog["schemas"])
+
+    max_schemas = min(max_schemas, LISTING_CACHE_SIZE)
+    truncated = len(schemas) > max_schemas
+    schemas = schemas[:max_schemas]
+    table_responses = await asyncio.gather(
+        *[list_tables(catalog_name, schema["name"]) for catalog_name, schema in schemas],
+        return_exceptions=True,
+    )
+
+    for (_, schema), response in zip(schemas, table_responses):
+        if isinstance(response, Exception):
+            schema["error"] = str(response)
+            continue
+        tables = response.get("tables", [])
+        truncated = truncated or len(tables) > max_tables
+        schema["tables"] = [t["name"] for t in tables[:max_tables]]
+
+    return {"catalogs": catalogs, "truncated": truncated}
+
+
+def _clear_listings() -> None:
+    for cached in (list_catalogs, list_schemas, list_tables, get_table_lineage):
+        cached.cache_clear()
+
+
+async def clear_cache() -> Dict[str, Any]:
+    """Drop cached catalog, schema, table and lineage listings so the next calls refetch them."""
+    _clear_listings()
+    return {"cleared": True}
@@ -4,9 +4,13 @@ Enhanced Unity Catalog API with response formatting and detail levels.
 Provides Unity Catalog exploration with context-optimized responses for AI agents.
 """
 
+import asyncio
+import base64
+import datetime
 import json
 import logging
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, List, Optional
 
 from databricks_mcp.core.utils import make_api_request
 from databricks_mcp.core.formatting import (
@@ -17,12 +21,64 @@ from databricks_mcp.core.formatting import (
     format_tables_markdown,
     format_table_detail_markdown,
     apply_truncation_if_needed,
+    trim_to_budget,
 )
 from databricks_mcp.api import sql
+from databricks_mcp.api.unity_catalog import catalog_url, lineage_url, schema_url, table_url
 
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode dates, UUIDs and bytes, which the stdlib encoder (and for bytes, orjson) rejects."""
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Serialize JSON responses with orjson when it is installed; both backends
+# emit the same text (naive datetimes without an offset, non-ASCII unescaped)
+try:
+    import orjson
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+else:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+
+# Catalog fields kept in concise JSON listings
+_CATALOG_CONCISE_KEYS = ("name", "comment")
+
+# Column fields read from the API and the keys they are returned under
+_COLUMN_KEYS = ("name", "type_name", "comment", "nullable")
+_COLUMN_FIELDS = ("name", "type", "comment", "nullable")
+
+# Notebook entity fields copied into processed lineage
+_NOTEBOOK_KEYS = ("name", "path", "job_id", "job_name")
+
+
+# Large listings yield to the event loop every _YIELD_EVERY items while they
+# are formatted, and serialize in a worker thread, so other tool calls keep running
+_YIELD_EVERY = 1000
+
+
+async def _dumps_async(obj: Any, item_count: int) -> str:
+    """Serialize like _dumps, off the event loop when there are many items."""
+    if item_count < _YIELD_EVERY:
+        return _dumps(obj)
+    return await asyncio.to_thread(_dumps, obj)
+
+
+def _format_columns(columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce raw column info to name, type, comment and nullable."""
+    return [dict(zip(_COLUMN_FIELDS, map(col.get, _COLUMN_KEYS))) for col in columns]
+
+
 async def list_catalogs_enhanced(
     response_format: ResponseFormat = ResponseFormat.MARKDOWN,
     detail_level: DetailLevel = DetailLevel.CONCISE
@@ -40,29 +96,29 @@ async def list_catalogs_enhanced(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Listing catalogs with format={response_format}, detail={detail_level}")
+    logger.info("Listing catalogs with format=%s, detail=%s", response_format, detail_level)
+
+    markdown = response_format == ResponseFormat.MARKDOWN
+    detailed = detail_level == DetailLevel.DETAILED
 
     # Get catalogs from API
     result = await make_api_request("GET", "/api/2.1/unity-catalog/catalogs")
     catalogs = result.get("catalogs", [])
 
-    if response_format == ResponseFormat.MARKDOWN:
+    if markdown:
         content = format_catalogs_markdown(catalogs, detail_level)
     else:  # JSON
-        if detail_level == DetailLevel.CONCISE:
+        if not detailed:
             # Concise: just essential fields
             catalogs_data = [
-                {
-                    "name": cat.get("name"),
-                    "comment": cat.get("comment"),
-                }
-                for cat in catalogs
+                dict(zip(_CATALOG_CONCISE_KEYS, map(cat.get, _CATALOG_CONCISE_KEYS)))
+                for cat in trim_to_budget(catalogs)
             ]
         else:
             # Detailed: all fields
-            catalogs_data = catalogs
+            catalogs_data = trim_to_budget(catalogs)
 
-        content = json.dumps({"catalogs": catalogs_data, "count": len(catalogs)}, indent=2)
+        content = await _dumps_async({"catalogs": catalogs_data, "count": len(catalogs)}, len(catalogs_data))
 
     return apply_truncation_if_needed(content, response_format)
 
@@ -86,23 +142,26 @@ async def describe_catalog_enhanced(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Describing catalog {catalog_name} with format={response_format}, detail={detail_level}")
-
-    # Get catalog details
-    catalog = await make_api_request("GET", f"/api/2.1/unity-catalog/catalogs/{catalog_name}")
-
-    # Get schemas
-    schemas_result = await make_api_request(
-        "GET",
-        "/api/2.1/unity-catalog/schemas",
-        params={"catalog_name": catalog_name}
+    logger.info("Describing catalog %s with format=%s, detail=%s", catalog_name, response_format, detail_level)
+
+    markdown = response_format == ResponseFormat.MARKDOWN
+    detailed = detail_level == DetailLevel.DETAILED
+
+    # Get catalog details and its schemas concurrently
+    catalog, schemas_result = await asyncio.gather(
+        make_api_request("GET", catalog_url(catalog_name)),
+        make_api_request(
+            "GET",
+            "/api/2.1/unity-catalog/schemas",
+            params={"catalog_name": catalog_name}
+        ),
     )
     schemas = schemas_result.get("schemas", [])
 
-    if response_format == ResponseFormat.MARKDOWN:
+    if markdown:
         lines = [f"# Catalog: {catalog.get('name')}", ""]
 
-        if detail_level == DetailLevel.DETAILED:
+        if detailed:
             if catalog.get("comment"):
                 lines.append(f"**Description**: {catalog['comment']}")
             if catalog.get("owner"):
@@ -120,19 +179,25 @@ async def describe_catalog_enhanced(
         if not schemas:
             lines.append("No schemas found in this catalog.")
         else:
-            for schema in schemas:
-                lines.append(f"### {schema.get('name')}")
-                if schema.get("comment"):
-                    lines.append(f"- {schema['comment']}")
-                if detail_level == DetailLevel.DETAILED and schema.get("owner"):
-                    lines.append(f"- Owner: {schema['owner']}")
-                lines.append("")
+            append = lines.append
+            for i, schema in enumerate(trim_to_budget(schemas), 1):
+                append(f"### {schema.get('name')}")
+                comment = schema.get("comment")
+                if comment:
+                    append(f"- {comment}")
+                if detailed:
+                    owner = schema.get("owner")
+                    if owner:
+                        append(f"- Owner: {owner}")
+                append("")
+                if i % _YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
 
         content = "\n".join(lines)
     else:  # JSON
         catalog_dict = {"name": catalog.get("name")}
 
-        if detail_level == DetailLevel.DETAILED:
+        if detailed:
             catalog_dict.update({
                 "comment": catalog.get("comment"),
                 "owner": catalog.get("owner"),
@@ -143,9 +208,9 @@ async def describe_catalog_enhanced(
             catalog_dict["comment"] = catalog["comment"]
 
         schemas_data = []
-        for schema in schemas:
+        for i, schema in enumerate(trim_to_budget(schemas), 1):
             schema_dict = {"name": schema.get("name")}
-            if detail_level == DetailLevel.DETAILED:
+            if detailed:
                 schema_dict.update({
                     "comment": schema.get("comment"),
                     "owner": schema.get("owner"),
@@ -153,12 +218,14 @@ async def describe_catalog_enhanced(
             elif schema.get("comment"):
                 schema_dict["comment"] = schema["comment"]
             schemas_data.append(schema_dict)
+            if i % _YIELD_EVERY == 0:
+                await asyncio.sleep(0)
 
-        content = json.dumps({
+        content = await _dumps_async({
             "catalog": catalog_dict,
             "schemas": schemas_data,
             "schema_count": len(schemas)
-        }, indent=2)
+        }, len(schemas_data))
 
     return apply_truncation_if_needed(content, response_format)
 
@@ -187,25 +254,25 @@ async def describe_schema_enhanced(
         DatabricksAPIError: If the API request fails
     """
     logger.info(
-        f"Describing schema {catalog_name}.{schema_name} "
-        f"with columns={include_columns}, format={response_format}, detail={detail_level}"
-    )
-
-    # Get schema details
-    schema = await make_api_request(
-        "GET",
-        f"/api/2.1/unity-catalog/schemas/{catalog_name}.{schema_name}"
+        "Describing schema %s.%s with columns=%s, format=%s, detail=%s",
+        catalog_name, schema_name, include_columns, response_format, detail_level,
     )
 
-    # Get tables
-    tables_result = await make_api_request(
-        "GET",
-        "/api/2.1/unity-catalog/tables",
-        params={"catalog_name": catalog_name, "schema_name": schema_name}
+    markdown = response_format == ResponseFormat.MARKDOWN
+    detailed = detail_level == DetailLevel.DETAILED
+
+    # Get schema details and its tables concurrently
+    schema, tables_result = await asyncio.gather(
+        make_api_request("GET", schema_url(f"{catalog_name}.{schema_name}")),
+        make_api_request(
+            "GET",
+            "/api/2.1/unity-catalog/tables",
+            params={"catalog_name": catalog_name, "schema_name": schema_name}
+        ),
     )
     tables = tables_result.get("tables", [])
 
-    if response_format == ResponseFormat.MARKDOWN:
+    if markdown:
         content = format_tables_markdown(
             tables,
             f"{catalog_name}.{schema_name}",
@@ -219,7 +286,7 @@ async def describe_schema_enhanced(
             "name": schema_name,
         }
 
-        if detail_level == DetailLevel.DETAILED:
+        if detailed:
             schema_dict.update({
                 "comment": schema.get("comment"),
                 "owner": schema.get("owner"),
@@ -229,34 +296,28 @@ async def describe_schema_enhanced(
             schema_dict["comment"] = schema["comment"]
 
         tables_data = []
-        for table in tables:
+        for i, table in enumerate(trim_to_budget(tables), 1):
             table_dict = {
                 "name": table.get("name"),
                 "table_type": table.get("table_type"),
             }
 
-            if detail_level == DetailLevel.DETAILED or include_columns:
+            if detailed or include_columns:
                 if table.get("comment"):
                     table_dict["comment"] = table["comment"]
 
             if include_columns and table.get("columns"):
-                table_dict["columns"] = [
-                    {
-                        "name": col.get("name"),
-                        "type": col.get("type_name"),
-                        "comment": col.get("comment"),
-                        "nullable": col.get("nullable"),
-                    }
-                    for col in table["columns"]
-                ]
+                table_dict["columns"] = _format_columns(table["columns"])
 
             tables_data.append(table_dict)
+            if i % _YIELD_EVERY == 0:
+                await asyncio.sleep(0)
 
-        content = json.dumps({
+        content = await _dumps_async({
             "schema": schema_dict,
             "tables": tables_data,
             "table_count": len(tables)
-        }, indent=2)
+        }, len(tables_data))
 
     return apply_truncation_if_needed(content, response_format)
 
@@ -283,34 +344,41 @@ async def describe_table_enhanced(
         DatabricksAPIError: If the API request fails
     """
     logger.info(
-        f"Describing table {full_table_name} "
-        f"with lineage={include_lineage}, format={response_format}, detail={detail_level}"
+        "Describing table %s with lineage=%s, format=%s, detail=%s",
+        full_table_name, include_lineage, response_format, detail_level,
     )
 
+    markdown = response_format == ResponseFormat.MARKDOWN
+    detailed = detail_level == DetailLevel.DETAILED
+
     # Get table details
-    table = await make_api_request(
-        "GET",
-        f"/api/2.1/unity-catalog/tables/{full_table_name}"
-    )
+    table_request = make_api_request("GET", table_url(full_table_name))
 
     lineage = None
-    if include_lineage:
+    if not include_lineage:
+        table = await table_request
+    else:
+        # Get lineage alongside the table; a lineage failure only adds a note
+        table, lineage_result = await asyncio.gather(
+            table_request,
+            make_api_request("GET", lineage_url(full_table_name)),
+            return_exceptions=True,
+        )
+        if isinstance(table, BaseException):
+            raise table
         try:
-            # Get lineage from API
-            lineage_result = await make_api_request(
-                "GET",
-                f"/api/2.1/unity-catalog/lineage-tracking/table-lineage/{full_table_name}"
-            )
+            if isinstance(lineage_result, BaseException):
+                raise lineage_result
             # Process lineage data
             lineage = _process_lineage_data(lineage_result)
         except Exception as e:
-            logger.warning(f"Failed to fetch lineage: {e}")
+            logger.warning("Failed to fetch lineage: %s", e)
             lineage = {
                 "error": str(e),
                 "note": "Lineage requires access to system.access.table_lineage table"
             }
 
-    if response_format == ResponseFormat.MARKDOWN:
+    if markdown:
         content = format_table_detail_markdown(table, lineage, detail_level)
     else:  # JSON
         table_dict = {
@@ -320,7 +388,7 @@ async def describe_table_enhanced(
             "data_source_format": table.get("data_source_format"),
         }
 
-        if detail_level == DetailLevel.DETAILED:
+        if detailed:
             table_dict.update({
                 "comment": table.get("comment"),
                 "storage_location": table.get("storage_location"),
@@ -331,21 +399,13 @@ async def describe_table_enhanced(
             table_dict["comment"] = table["comment"]
 
         if table.get("columns"):
-            table_dict["columns"] = [
-                {
-                    "name": col.get("name"),
-                    "type": col.get("type_name"),
-                    "comment": col.get("comment"),
-                    "nullable": col.get("nullable"),
-                }
-                for col in table["columns"]
-            ]
+            table_dict["columns"] = _format_columns(table["columns"])
 
         response_data = {"table": table_dict}
         if lineage:
             response_data["lineage"] = lineage
 
-        content = json.dumps(response_data, indent=2)
+        content = await _dumps_async(response_data, len(table.get("columns") or ()))
 
     return apply_truncation_if_needed(content, response_format)
 
@@ -365,16 +425,12 @@ def _process_lineage_data(lineage_result: Dict[str, Any]) -> Dict[str, Any]:
     downstream_tables = lineage_result.get("downstream_tables", [])
 
     # Extract notebook and job information
-    notebooks = []
-    for entity in lineage_result.get("entities", []):
-        if entity.get("entity_type") == "NOTEBOOK":
-            notebooks.append({
-                "name": entity.get("name"),
-                "path": entity.get("path"),
-                "job_id": entity.get("job_id"),
-                "job_name": entity.get("job_name"),
-                "operations": entity.get("operations", []),
-            })
+    # One dict per notebook, built in place; the formatters and _dumps read it directly
+    notebooks = [
+        dict(zip(_NOTEBOOK_KEYS, map(entity.get, _NOTEBOOK_KEYS)), operations=entity.get("operations", []))
+        for entity in lineage_result.get("entities", ())
+        if entity.get("entity_type") == "NOTEBOOK"
+    ]
 
     return {
         "upstream_tables": upstream_tables,
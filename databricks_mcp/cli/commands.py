@@ -5,12 +5,12 @@ This module provides command-line functionality for interacting with the Databri
 """
 
 import argparse
-import asyncio
 import logging
 import sys
 from typing import List, Optional
 
-from databricks_mcp.server.databricks_mcp_server import DatabricksMCPServer, main as server_main
+# The server and API modules are imported inside the commands that need them,
+# so "--help" and "version" start without loading httpx, mcp and the API surface.
 
 # Configure logging
 logging.basicConfig(
@@ -53,6 +53,8 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
 
 async def list_tools() -> None:
     """List all available tools in the server."""
+    from databricks_mcp.server.databricks_mcp_server import DatabricksMCPServer
+
     server = DatabricksMCPServer()
     tools = await server.list_tools()
     
@@ -63,12 +65,15 @@ async def list_tools() -> None:
 
 def show_version() -> None:
     """Show the server version."""
-    server = DatabricksMCPServer()
-    print(f"\nDatabricks MCP Server v{server.version}")
+    from databricks_mcp.core.config import VERSION
+
+    print(f"\nDatabricks MCP Server v{VERSION}")
 
 
 async def sync_run(repo_id: int, notebook_path: str, cluster_id: Optional[str]) -> None:
     """Convenience wrapper for the sync_repo_and_run_notebook tool."""
+    from databricks_mcp.server.databricks_mcp_server import DatabricksMCPServer
+
     server = DatabricksMCPServer()
     params = {
         "repo_id": repo_id,
@@ -91,13 +96,20 @@ def main(args: Optional[List[str]] = None) -> int:
     
     # Execute the appropriate command
     if parsed_args.command == "start":
+        from databricks_mcp.server.databricks_mcp_server import main as server_main
+
         logger.info("Starting Databricks MCP server")
-        asyncio.run(server_main())
+        # server_main runs its own event loop via FastMCP.run
+        server_main()
     elif parsed_args.command == "list-tools":
+        import asyncio
+
         asyncio.run(list_tools())
     elif parsed_args.command == "version":
         show_version()
     elif parsed_args.command == "sync-run":
+        import asyncio
+
         asyncio.run(sync_run(parsed_args.repo_id, parsed_args.notebook_path, parsed_args.cluster_id))
     else:
         # If no command is provided, show help
@@ -3,32 +3,29 @@ Configuration settings for the Databricks MCP server.
 """
 
 import os
-from typing import Any, Dict, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings
 
 # Import dotenv if available, but don't require it
-# Only load dotenv if not running via Cursor MCP (which provides env vars directly)
-# Avoid printing to stdout in MCP context; also never print status to stdout
-if not os.environ.get("RUNNING_VIA_CURSOR_MCP"):
+# Only load dotenv if not running via Cursor MCP (which provides env vars directly).
+# The environment flag makes child processes skip reloading it, and status is
+# only reported (on stderr, never stdout) when DEBUG is set.
+if not os.environ.get("RUNNING_VIA_CURSOR_MCP") and os.environ.get("DATABRICKS_MCP_ENV_LOADED") != "1":
     try:
         from dotenv import load_dotenv
+
         # Load .env file if it exists
-        # Suppress any prints; use stderr for optional diagnostics
-        loaded = load_dotenv()
-        if loaded:
-            import sys as _sys
-            print("Successfully loaded .env file", file=_sys.stderr)
-        else:
-            import sys as _sys
-            print("No .env file found or it is empty", file=_sys.stderr)
+        _env_status = "Successfully loaded .env file" if load_dotenv() else "No .env file found or it is empty"
     except ImportError:
-        import sys as _sys
-        print("WARNING: python-dotenv not found, relying on environment variables.", file=_sys.stderr)
-else:
-    # In MCP environment, skip dotenv and avoid stdout prints
-    pass
-
-from pydantic import field_validator
-from pydantic_settings import BaseSettings
+        _env_status = "WARNING: python-dotenv not found, relying on environment variables."
+    if os.environ.get("DEBUG", "").lower() == "true":
+        print(_env_status, file=sys.stderr)
+    os.environ["DATABRICKS_MCP_ENV_LOADED"] = "1"
 
 # Version
 VERSION = "0.2.1"
@@ -38,17 +35,21 @@ class Settings(BaseSettings):
     """Base settings for the application."""
 
     # Databricks API configuration
-    DATABRICKS_HOST: str = os.environ.get("DATABRICKS_HOST", "https://example.databricks.net")
-    DATABRICKS_TOKEN: str = os.environ.get("DATABRICKS_TOKEN", "dapi_token_placeholder")
-    DATABRICKS_WAREHOUSE_ID: Optional[str] = os.environ.get("DATABRICKS_WAREHOUSE_ID")
+    DATABRICKS_HOST: str = "https://example.databricks.net"
+    DATABRICKS_TOKEN: str = "dapi_token_placeholder"
+    DATABRICKS_WAREHOUSE_ID: Optional[str] = None
+    # Maximum number of Databricks API requests in flight at once
+    DATABRICKS_MAX_CONCURRENCY: int = 32
 
     # Server configuration
-    SERVER_HOST: str = os.environ.get("SERVER_HOST", "0.0.0.0") 
-    SERVER_PORT: int = int(os.environ.get("SERVER_PORT", "8000"))
-    DEBUG: bool = os.environ.get("DEBUG", "False").lower() == "true"
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    DEBUG: bool = False
+    # Fetch the catalog listing into its cache at startup (one extra request)
+    PREWARM_CACHES: bool = False
 
     # Logging
-    LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = "INFO"
     
     # Version
     VERSION: str = VERSION
@@ -66,7 +67,7 @@ class Settings(BaseSettings):
         if v and len(v) < 10:
             import logging
             logger = logging.getLogger(__name__)
-            logger.warning(f"Warehouse ID '{v}' seems unusually short")
+            logger.warning("Warehouse ID '%s' seems unusually short", v)
         return v
 
     class Config:
@@ -80,14 +81,21 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-def get_api_headers() -> Dict[str, str]:
+# Request headers and host prefix never change after startup, so build them once
+_API_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Authorization": f"Bearer {settings.DATABRICKS_TOKEN}",
+    "Content-Type": "application/json",
+})
+_HOST_PREFIX = settings.DATABRICKS_HOST.rstrip("/")
+
+
+def get_api_headers() -> Mapping[str, str]:
     """Get headers for Databricks API requests."""
-    return {
-        "Authorization": f"Bearer {settings.DATABRICKS_TOKEN}",
-        "Content-Type": "application/json",
-    }
+    return _API_HEADERS
 
 
+# Pollers and list tools hit the same few endpoints over and over
+@lru_cache(maxsize=256)
 def get_databricks_api_url(endpoint: str) -> str:
     """
     Construct the full Databricks API URL.
@@ -98,11 +106,4 @@ def get_databricks_api_url(endpoint: str) -> str:
     Returns:
         Full URL to the Databricks API endpoint
     """
-    # Ensure endpoint starts with a slash
-    if not endpoint.startswith("/"):
-        endpoint = f"/{endpoint}"
-
-    # Remove trailing slash from host if present
-    host = settings.DATABRICKS_HOST.rstrip("/")
-    
-    return f"{host}{endpoint}" 
\ No newline at end of file
+    return _HOST_PREFIX + (endpoint if endpoint.startswith("/") else "/" + endpoint)
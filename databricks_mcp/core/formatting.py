@@ -5,10 +5,10 @@ Provides response formatting, truncation, and detail level management
 to optimize for limited context windows in AI agent interactions.
 """
 
-import json
+import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
-from datetime import datetime
 
 
 class ResponseFormat(str, Enum):
@@ -25,6 +25,7 @@ class DetailLevel(str, Enum):
 
 # Constants
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
 
 
 def format_timestamp(ts: Optional[int]) -> str:
@@ -40,11 +41,19 @@ def format_timestamp(ts: Optional[int]) -> str:
     if not ts:
         return "N/A"
     try:
-        return datetime.fromtimestamp(ts / 1000).strftime("%Y-%m-%d %H:%M:%S UTC")
-    except (ValueError, OSError):
+        # Output has second precision, so timestamps within a second share an entry
+        return _format_epoch_seconds(ts // 1000)
+    except (ValueError, OSError, OverflowError):
         return f"Invalid timestamp: {ts}"
 
 
+@lru_cache(maxsize=4096)
+def _format_epoch_seconds(seconds: int) -> str:
+    """Format whole epoch seconds; listings repeat the same timestamps often."""
+    # gmtime, not localtime: the output is labelled UTC
+    return time.strftime(_TIMESTAMP_FORMAT, time.gmtime(seconds))
+
+
 def truncate_response(data: str, max_chars: int = CHARACTER_LIMIT) -> Tuple[str, bool]:
     """
     Truncate response if it exceeds character limit.
@@ -63,6 +72,36 @@ def truncate_response(data: str, max_chars: int = CHARACTER_LIMIT) -> Tuple[str,
     return truncated, True
 
 
+def trim_to_budget(
+    items: List[Dict[str, Any]],
+    max_chars: int = CHARACTER_LIMIT,
+    fields: Tuple[str, ...] = ("name", "comment"),
+) -> List[Dict[str, Any]]:
+    """
+    Drop list items that cannot appear in a response truncated to max_chars.
+
+    Each item is estimated by the length of its text fields, which is a lower
+    bound on its formatted size. Items are kept until the running estimate
+    passes max_chars, so the formatted output still overflows and
+    truncate_response still reports the truncation.
+
+    Args:
+        items: Items about to be formatted
+        max_chars: Maximum characters allowed in the response
+        fields: Keys whose string values count toward the estimate
+
+    Returns:
+        The leading items worth formatting (the original list if all fit)
+    """
+    total = 0
+    for i, item in enumerate(items):
+        for field in fields:
+            total += len(item.get(field) or "")
+        if total > max_chars:
+            return items[:i + 1]
+    return items
+
+
 def format_catalogs_markdown(
     catalogs: List[Dict[str, Any]],
     detail_level: DetailLevel = DetailLevel.CONCISE
@@ -77,28 +116,27 @@ def format_catalogs_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = ["# Unity Catalogs", "", f"Found {len(catalogs)} catalogs", ""]
-
-    for catalog in catalogs:
-        lines.append(f"## {catalog.get('name', 'Unknown')}")
-
-        if detail_level == DetailLevel.DETAILED:
-            if catalog.get('catalog_type'):
-                lines.append(f"- **Type**: {catalog['catalog_type']}")
-            if catalog.get('comment'):
-                lines.append(f"- **Description**: {catalog['comment']}")
-            if catalog.get('owner'):
-                lines.append(f"- **Owner**: {catalog['owner']}")
-            if catalog.get('created_at'):
-                lines.append(f"- **Created**: {format_timestamp(catalog['created_at'])}")
-        else:
-            # Concise mode: just name and description
-            if catalog.get('comment'):
-                lines.append(f"- {catalog['comment']}")
+    detailed = detail_level == DetailLevel.DETAILED
+    blocks = [_format_catalog_block(catalog, detailed) for catalog in catalogs]
+    return "\n".join(["# Unity Catalogs", "", f"Found {len(catalogs)} catalogs", "", *blocks])
 
-        lines.append("")
 
-    return "\n".join(lines)
+def _format_catalog_block(catalog: Dict[str, Any], detailed: bool) -> str:
+    """Format one catalog as a Markdown block ending in a newline."""
+    name = catalog.get('name', 'Unknown')
+    comment = catalog.get('comment')
+    if not detailed:
+        # Concise mode: just name and description
+        return f"## {name}\n- {comment}\n" if comment else f"## {name}\n"
+
+    catalog_type, owner, created_at = catalog.get('catalog_type'), catalog.get('owner'), catalog.get('created_at')
+    return "".join([
+        f"## {name}\n",
+        f"- **Type**: {catalog_type}\n" if catalog_type else "",
+        f"- **Description**: {comment}\n" if comment else "",
+        f"- **Owner**: {owner}\n" if owner else "",
+        f"- **Created**: {format_timestamp(created_at)}\n" if created_at else "",
+    ])
 
 
 def format_schemas_markdown(
@@ -117,26 +155,29 @@ def format_schemas_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = [f"# Catalog: {catalog_name}", "", f"## Schemas ({len(schemas)})", ""]
+    header = [f"# Catalog: {catalog_name}", "", f"## Schemas ({len(schemas)})", ""]
 
     if not schemas:
-        lines.append("No schemas found in this catalog.")
-        return "\n".join(lines)
+        return "\n".join([*header, "No schemas found in this catalog."])
 
-    for schema in schemas:
-        lines.append(f"### {schema.get('name', 'Unknown')}")
-        if schema.get('comment'):
-            lines.append(f"- {schema['comment']}")
+    detailed = detail_level == DetailLevel.DETAILED
+    blocks = [_format_schema_block(schema, detailed) for schema in schemas]
+    return "\n".join([*header, *blocks])
 
-        if detail_level == DetailLevel.DETAILED:
-            if schema.get('owner'):
-                lines.append(f"- Owner: {schema['owner']}")
-            if schema.get('created_at'):
-                lines.append(f"- Created: {format_timestamp(schema['created_at'])}")
 
-        lines.append("")
+def _format_schema_block(schema: Dict[str, Any], detailed: bool) -> str:
+    """Format one schema as a Markdown block ending in a newline."""
+    name, comment = schema.get('name', 'Unknown'), schema.get('comment')
+    block = f"### {name}\n- {comment}\n" if comment else f"### {name}\n"
+    if not detailed:
+        return block
 
-    return "\n".join(lines)
+    owner, created_at = schema.get('owner'), schema.get('created_at')
+    return "".join([
+        block,
+        f"- Owner: {owner}\n" if owner else "",
+        f"- Created: {format_timestamp(created_at)}\n" if created_at else "",
+    ])
 
 
 def format_tables_markdown(
@@ -157,32 +198,35 @@ def format_tables_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = [f"# Schema: {schema_name}", "", f"## Tables ({len(tables)})", ""]
+    header = [f"# Schema: {schema_name}", "", f"## Tables ({len(tables)})", ""]
 
     if not tables:
-        lines.append("No tables found in this schema.")
-        return "\n".join(lines)
-
-    for table in tables:
-        lines.append(f"### {table.get('name', 'Unknown')}")
-        if table.get('comment'):
-            lines.append(f"- {table['comment']}")
-
-        if detail_level == DetailLevel.DETAILED or include_columns:
-            if table.get('table_type'):
-                lines.append(f"- **Type**: {table['table_type']}")
-
-        if include_columns and table.get('columns'):
-            lines.append("- **Columns**:")
-            for col in table['columns']:
-                col_line = f"  - {col.get('name', 'unknown')} ({col.get('type_name', 'unknown')})"
-                if col.get('comment'):
-                    col_line += f" - {col['comment']}"
-                lines.append(col_line)
+        return "\n".join([*header, "No tables found in this schema."])
 
-        lines.append("")
+    show_type = detail_level == DetailLevel.DETAILED or include_columns
+    blocks = [_format_table_block(table, show_type, include_columns) for table in tables]
+    return "\n".join([*header, *blocks])
 
-    return "\n".join(lines)
+
+def _format_table_block(table: Dict[str, Any], show_type: bool, include_columns: bool) -> str:
+    """Format one table listing entry as a Markdown block ending in a newline."""
+    columns = table.get('columns') if include_columns else None
+    comment = table.get('comment')
+    table_type = table.get('table_type') if show_type else None
+    return "".join([
+        f"### {table.get('name', 'Unknown')}\n",
+        f"- {comment}\n" if comment else "",
+        f"- **Type**: {table_type}\n" if table_type else "",
+        "- **Columns**:\n" if columns else "",
+        *[_format_listed_column(col) for col in columns or ()],
+    ])
+
+
+def _format_listed_column(col: Dict[str, Any]) -> str:
+    """Format one column nested under a table listing entry."""
+    line = f"  - {col.get('name', 'unknown')} ({col.get('type_name', 'unknown')})"
+    comment = col.get('comment')
+    return f"{line} - {comment}\n" if comment else f"{line}\n"
 
 
 def format_table_detail_markdown(
@@ -203,37 +247,36 @@ def format_table_detail_markdown(
     """
     lines = [f"# Table: {table.get('full_name', 'Unknown')}", ""]
 
-    if table.get('comment'):
-        lines.append(f"{table['comment']}")
+    comment = table.get('comment')
+    if comment:
+        lines.append(f"{comment}")
         lines.append("")
 
     # Table metadata
-    if table.get('table_type'):
-        lines.append(f"- **Type**: {table['table_type']}")
-    if table.get('data_source_format'):
-        lines.append(f"- **Format**: {table['data_source_format']}")
-
-    if detail_level == DetailLevel.DETAILED:
-        if table.get('storage_location'):
-            lines.append(f"- **Location**: {table['storage_location']}")
-        if table.get('owner'):
-            lines.append(f"- **Owner**: {table['owner']}")
-        if table.get('created_at'):
-            lines.append(f"- **Created**: {format_timestamp(table['created_at'])}")
+    table_type, data_source_format = table.get('table_type'), table.get('data_source_format')
+    if table_type:
+        lines.append(f"- **Type**: {table_type}")
+    if data_source_format:
+        lines.append(f"- **Format**: {data_source_format}")
+
+    detailed = detail_level == DetailLevel.DETAILED
+    if detailed:
+        storage_location, owner, created_at = table.get('storage_location'), table.get('owner'), table.get('created_at')
+        if storage_location:
+            lines.append(f"- **Location**: {storage_location}")
+        if owner:
+            lines.append(f"- **Owner**: {owner}")
+        if created_at:
+            lines.append(f"- **Created**: {format_timestamp(created_at)}")
 
     lines.append("")
 
     # Columns
-    if table.get('columns'):
-        lines.append(f"## Columns ({len(table['columns'])})")
+    columns = table.get('columns')
+    if columns:
+        lines.append(f"## Columns ({len(columns)})")
         lines.append("")
-        for col in table['columns']:
-            col_line = f"- **{col.get('name', 'unknown')}** ({col.get('type_name', 'unknown')})"
-            if col.get('comment'):
-                col_line += f" - {col['comment']}"
-            if detail_level == DetailLevel.DETAILED and not col.get('nullable'):
-                col_line += " [NOT NULL]"
-            lines.append(col_line)
+        lines.extend([_format_column_line(col, detailed) for col in columns])
         lines.append("")
 
     # Lineage
@@ -242,33 +285,49 @@ def format_table_detail_markdown(
         lines.append("")
 
         if lineage.get('upstream_tables'):
-            lines.append("### Upstream Tables")
-            lines.append("Tables that this table reads from:")
-            for table_name in lineage['upstream_tables']:
-                lines.append(f"- {table_name}")
-            lines.append("")
+            lines.extend([
+                "### Upstream Tables",
+                "Tables that this table reads from:",
+                *[f"- {table_name}" for table_name in lineage['upstream_tables']],
+                "",
+            ])
 
         if lineage.get('downstream_tables'):
-            lines.append("### Downstream Tables")
-            lines.append("Tables that read from this table:")
-            for table_name in lineage['downstream_tables']:
-                lines.append(f"- {table_name}")
-            lines.append("")
+            lines.extend([
+                "### Downstream Tables",
+                "Tables that read from this table:",
+                *[f"- {table_name}" for table_name in lineage['downstream_tables']],
+                "",
+            ])
 
         if lineage.get('notebooks'):
-            lines.append("### Notebooks")
-            lines.append("")
-            for notebook in lineage['notebooks']:
-                lines.append(f"#### {notebook.get('name', 'Unnamed')}")
-                lines.append(f"- **Path**: {notebook.get('path')}")
-                if notebook.get('job_name'):
-                    lines.append(f"- **Job**: {notebook['job_name']} (ID: {notebook.get('job_id')})")
-                lines.append(f"- **Operations**: {', '.join(notebook.get('operations', []))}")
-                lines.append("")
+            lines.extend(["### Notebooks", ""])
+            lines.extend([_format_lineage_notebook(notebook) for notebook in lineage['notebooks']])
 
     return "\n".join(lines)
 
 
+def _format_lineage_notebook(notebook: Dict[str, Any]) -> str:
+    """Format one lineage notebook as a Markdown block ending in a newline."""
+    job_name = notebook.get('job_name')
+    return "".join([
+        f"#### {notebook.get('name', 'Unnamed')}\n",
+        f"- **Path**: {notebook.get('path')}\n",
+        f"- **Job**: {job_name} (ID: {notebook.get('job_id')})\n" if job_name else "",
+        f"- **Operations**: {', '.join(notebook.get('operations', []))}\n",
+    ])
+
+
+def _format_column_line(col: Dict[str, Any], detailed: bool) -> str:
+    """Format one column of a table detail view as a Markdown list item."""
+    comment = col.get('comment')
+    return "".join([
+        f"- **{col.get('name', 'unknown')}** ({col.get('type_name', 'unknown')})",
+        f" - {comment}" if comment else "",
+        " [NOT NULL]" if detailed and not col.get('nullable') else "",
+    ])
+
+
 def format_sql_results_markdown(
     columns: List[str],
     rows: List[List[Any]],
@@ -287,41 +346,39 @@ def format_sql_results_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = ["# Query Results", ""]
-
     if execution_time:
-        lines.append(f"Executed in {execution_time:.2f} seconds")
-    lines.append(f"Returned {len(rows)} rows")
-    lines.append("")
+        header = ["# Query Results", "", f"Executed in {execution_time:.2f} seconds", f"Returned {len(rows)} rows", ""]
+    else:
+        header = ["# Query Results", "", f"Returned {len(rows)} rows", ""]
 
     # Create markdown table
     if rows:
-        # Header row
-        lines.append("| " + " | ".join(columns) + " |")
-        # Separator row
-        lines.append("|" + "|".join(["---" for _ in columns]) + "|")
-        # Data rows
-        for row in rows:
-            formatted_row = []
-            for val in row:
-                if val is None:
-                    formatted_row.append("NULL")
-                elif isinstance(val, (int, float)):
-                    formatted_row.append(str(val))
-                else:
-                    formatted_row.append(str(val)[:50])  # Truncate long values
-            lines.append("| " + " | ".join(formatted_row) + " |")
+        table = [
+            f"| {' | '.join(columns)} |",
+            f"|{'|'.join(['---'] * len(columns))}|",
+            *[f"| {' | '.join([_format_cell(val) for val in row])} |" for row in rows],
+        ]
     else:
-        lines.append("No rows returned")
-
-    lines.append("")
+        table = ["No rows returned"]
 
     if truncated:
-        lines.append(f"[Showing first {len(rows)} rows - response truncated]")
+        footer = f"[Showing first {len(rows)} rows - response truncated]"
     else:
-        lines.append(f"[Showing all {len(rows)} rows]")
+        footer = f"[Showing all {len(rows)} rows]"
 
-    return "\n".join(lines)
+    return "\n".join([*header, *table, "", footer])
+
+
+def _format_cell(val: Any) -> str:
+    """Render one SQL result value for a Markdown table cell."""
+    # JSON_ARRAY results arrive as strings; slice them without coercion.
+    if type(val) is str:
+        return val[:50]
+    if val is None:
+        return "NULL"
+    if isinstance(val, (int, float)):
+        return str(val)
+    return str(val)[:50]  # Truncate long values
 
 
 def format_clusters_markdown(
@@ -338,27 +395,35 @@ def format_clusters_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = ["# Databricks Clusters", "", f"Found {len(clusters)} clusters", ""]
-
-    for cluster in clusters:
-        lines.append(f"## {cluster.get('cluster_name', 'Unknown')}")
-        lines.append(f"- **Cluster ID**: {cluster.get('cluster_id')}")
-        lines.append(f"- **State**: {cluster.get('state', 'Unknown')}")
-
-        if detail_level == DetailLevel.DETAILED:
-            if cluster.get('spark_version'):
-                lines.append(f"- **Spark Version**: {cluster['spark_version']}")
-            if cluster.get('node_type_id'):
-                lines.append(f"- **Node Type**: {cluster['node_type_id']}")
-            if cluster.get('num_workers') is not None:
-                lines.append(f"- **Workers**: {cluster['num_workers']}")
-            elif cluster.get('autoscale'):
-                autoscale = cluster['autoscale']
-                lines.append(f"- **Autoscale**: {autoscale.get('min_workers')} - {autoscale.get('max_workers')} workers")
-
-        lines.append("")
-
-    return "\n".join(lines)
+    detailed = detail_level == DetailLevel.DETAILED
+    blocks = [_format_cluster_block(cluster, detailed) for cluster in clusters]
+    return "\n".join(["# Databricks Clusters", "", f"Found {len(clusters)} clusters", "", *blocks])
+
+
+def _format_cluster_block(cluster: Dict[str, Any], detailed: bool) -> str:
+    """Format one cluster as a Markdown block ending in a newline."""
+    block = (
+        f"## {cluster.get('cluster_name', 'Unknown')}\n"
+        f"- **Cluster ID**: {cluster.get('cluster_id')}\n"
+        f"- **State**: {cluster.get('state', 'Unknown')}\n"
+    )
+    if not detailed:
+        return block
+
+    num_workers, autoscale = cluster.get('num_workers'), cluster.get('autoscale')
+    if num_workers is not None:
+        workers = f"- **Workers**: {num_workers}\n"
+    elif autoscale:
+        workers = f"- **Autoscale**: {autoscale.get('min_workers')} - {autoscale.get('max_workers')} workers\n"
+    else:
+        workers = ""
+    spark_version, node_type_id = cluster.get('spark_version'), cluster.get('node_type_id')
+    return "".join([
+        block,
+        f"- **Spark Version**: {spark_version}\n" if spark_version else "",
+        f"- **Node Type**: {node_type_id}\n" if node_type_id else "",
+        workers,
+    ])
 
 
 def format_jobs_markdown(
@@ -375,24 +440,27 @@ def format_jobs_markdown(
     Returns:
         Formatted Markdown string
     """
-    lines = ["# Databricks Jobs", "", f"Found {len(jobs)} jobs", ""]
+    detailed = detail_level == DetailLevel.DETAILED
+    blocks = [_format_job_block(job, detailed) for job in jobs]
+    return "\n".join(["# Databricks Jobs", "", f"Found {len(jobs)} jobs", "", *blocks])
 
-    for job in jobs:
-        settings = job.get('settings', {})
-        lines.append(f"## {settings.get('name', 'Unnamed Job')}")
-        lines.append(f"- **Job ID**: {job.get('job_id')}")
 
-        if detail_level == DetailLevel.DETAILED:
-            if settings.get('schedule'):
-                lines.append(f"- **Schedule**: {settings['schedule'].get('quartz_cron_expression')}")
-            if settings.get('timeout_seconds'):
-                lines.append(f"- **Timeout**: {settings['timeout_seconds']}s")
-            if job.get('created_time'):
-                lines.append(f"- **Created**: {format_timestamp(job['created_time'])}")
+def _format_job_block(job: Dict[str, Any], detailed: bool) -> str:
+    """Format one job as a Markdown block ending in a newline."""
+    settings = job.get('settings', {})
+    block = f"## {settings.get('name', 'Unnamed Job')}\n- **Job ID**: {job.get('job_id')}\n"
+    if not detailed:
+        return block
 
-        lines.append("")
-
-    return "\n".join(lines)
+    schedule, timeout_seconds, created_time = (
+        settings.get('schedule'), settings.get('timeout_seconds'), job.get('created_time')
+    )
+    return "".join([
+        block,
+        f"- **Schedule**: {schedule.get('quartz_cron_expression')}\n" if schedule else "",
+        f"- **Timeout**: {timeout_seconds}s\n" if timeout_seconds else "",
+        f"- **Created**: {format_timestamp(created_time)}\n" if created_time else "",
+    ])
 
 
 def apply_truncation_if_needed(content: str, format_type: ResponseFormat) -> str:
@@ -412,13 +480,8 @@ def apply_truncation_if_needed(content: str, format_type: ResponseFormat) -> str
         if format_type == ResponseFormat.MARKDOWN:
             truncated_content += "\n\n[Response truncated due to size. Use filters or detail_level='concise' to reduce results.]"
         else:  # JSON
-            try:
-                data = json.loads(truncated_content)
-                data["truncated"] = True
-                data["truncation_message"] = "Response truncated due to size"
-                truncated_content = json.dumps(data, indent=2)
-            except json.JSONDecodeError:
-                # If can't parse, just add note
-                truncated_content += '\n{"truncated": true}'
+            # A prefix cut at max_chars is never a complete document, so
+            # parsing it to add keys would only fail; append the marker.
+            truncated_content += '\n{"truncated": true}'
 
     return truncated_content
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class JobTask(BaseModel):
+class _FrozenModel(BaseModel):
+    """Base for read-only API models; unknown response fields are dropped."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class JobTask(_FrozenModel):
     """Represents a Databricks job task."""
 
     task_key: str
@@ -14,7 +20,7 @@ class JobTask(BaseModel):
     new_cluster: Optional[Dict[str, Any]] = None
 
 
-class Job(BaseModel):
+class Job(_FrozenModel):
     """Simplified Databricks Job model used for job creation."""
 
     name: str
@@ -23,7 +29,7 @@ class Job(BaseModel):
     new_cluster: Optional[Dict[str, Any]] = None
 
 
-class Run(BaseModel):
+class Run(_FrozenModel):
     """Represents a Databricks job run."""
 
     run_id: int
@@ -31,7 +37,7 @@ class Run(BaseModel):
     state: Dict[str, Any]
 
 
-class WorkspaceObject(BaseModel):
+class WorkspaceObject(_FrozenModel):
     """Workspace object such as a notebook or directory."""
 
     path: str
@@ -39,7 +45,7 @@ class WorkspaceObject(BaseModel):
     language: Optional[str] = None
 
 
-class DbfsItem(BaseModel):
+class DbfsItem(_FrozenModel):
     """File or directory within DBFS."""
 
     path: str
@@ -47,7 +53,7 @@ class DbfsItem(BaseModel):
     file_size: Optional[int] = None
 
 
-class Library(BaseModel):
+class Library(_FrozenModel):
     """Specification of a library to install on a cluster."""
 
     pypi: Optional[Dict[str, str]] = None
@@ -56,7 +62,7 @@ class Library(BaseModel):
     whl: Optional[str] = None
 
 
-class Repo(BaseModel):
+class Repo(_FrozenModel):
     """Represents a Databricks repo."""
 
     id: Optional[int] = None
@@ -66,14 +72,14 @@ class Repo(BaseModel):
     path: Optional[str] = None
 
 
-class Catalog(BaseModel):
+class Catalog(_FrozenModel):
     """Unity Catalog catalog."""
 
     name: str
     comment: Optional[str] = None
 
 
-class Schema(BaseModel):
+class Schema(_FrozenModel):
     """Unity Catalog schema."""
 
     name: str
@@ -81,10 +87,31 @@ class Schema(BaseModel):
     comment: Optional[str] = None
 
 
-class Table(BaseModel):
+class Table(_FrozenModel):
     """Unity Catalog table."""
 
     name: str
     schema_name: str
     catalog_name: str
     comment: Optional[str] = None
+
+
+# Response views decoded with msgspec when it is installed. Decoding into a
+# view skips every field it doesn't declare instead of building full dicts.
+try:
+    import msgspec
+except ImportError:
+    RunStateView = None
+else:
+
+    class RunState(msgspec.Struct):
+        """Lifecycle fields of a job run state."""
+
+        life_cycle_state: Optional[str] = None
+        result_state: Optional[str] = None
+        state_message: Optional[str] = None
+
+    class RunStateView(msgspec.Struct):
+        """Only the state of a runs/get response."""
+
+        state: RunState = msgspec.field(default_factory=RunState)
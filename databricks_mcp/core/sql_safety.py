@@ -12,7 +12,7 @@ from typing import List, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 # Destructive SQL keywords that should be blocked for read-only operations
-DESTRUCTIVE_KEYWORDS = [
+DESTRUCTIVE_KEYWORDS = (
     "DROP",
     "DELETE",
     "TRUNCATE",
@@ -21,11 +21,44 @@ DESTRUCTIVE_KEYWORDS = [
     "INSERT",
     "MERGE",
     "CREATE",
-    "REPLACE"
-]
+    "REPLACE",
+)
 
 # Keywords that are allowed in subqueries but not as main operations
-CONDITIONAL_KEYWORDS = ["CREATE", "INSERT", "REPLACE"]
+CONDITIONAL_KEYWORDS = frozenset({"CREATE", "INSERT", "REPLACE"})
+
+# Keywords checked outside strict mode, in DESTRUCTIVE_KEYWORDS order
+_NON_CONDITIONAL_KEYWORDS = tuple(kw for kw in DESTRUCTIVE_KEYWORDS if kw not in CONDITIONAL_KEYWORDS)
+
+# Leading verbs of statements that can take the fast path in validate_read_only_sql
+_SAFE_LEADING_VERBS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "DESC", "EXPLAIN"})
+_LEADING_VERB_RE = re.compile(r"\s*([A-Za-z]+)")
+
+# Patterns compiled once at import
+_LINE_COMMENT_RE = re.compile(r"--[^\n]*")
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'[^']*'")
+_QUOTED_IDENTIFIER_RE = re.compile(r'"[^"]*"')
+# Every destructive keyword as a whole word, so one scan finds them all.
+# Whole-word matching avoids false positives like "SELECT created_at" matching "CREATE".
+_DESTRUCTIVE_KEYWORD_RE = re.compile(rf"\b({'|'.join(DESTRUCTIVE_KEYWORDS)})\b", re.IGNORECASE)
+_DANGEROUS_PATTERNS = [
+    (re.compile(r";\s*DROP\s+", re.IGNORECASE), "Contains statement separator followed by DROP"),
+    (re.compile(r";\s*DELETE\s+", re.IGNORECASE), "Contains statement separator followed by DELETE"),
+    (re.compile(r";\s*TRUNCATE\s+", re.IGNORECASE), "Contains statement separator followed by TRUNCATE"),
+]
+
+
+# Suggestions offered by suggest_safe_alternative, keyed by the keywords that trigger them
+_SUGGESTIONS = (
+    (("DROP",), "Instead of DROP, use SELECT to query the table structure: "
+                "DESCRIBE TABLE or SHOW COLUMNS FROM"),
+    (("DELETE", "TRUNCATE"), "Instead of deleting data, use SELECT with WHERE clause to view the data you want to remove"),
+    (("UPDATE",), "Instead of UPDATE, use SELECT to view the data you want to modify"),
+    (("INSERT",), "Instead of INSERT, use SELECT to query existing data. "
+                  "If you need to insert data, use a separate write-enabled tool."),
+)
 
 
 class SQLSafetyError(Exception):
@@ -57,16 +90,25 @@ def validate_read_only_sql(sql: str, strict_mode: bool = True) -> Tuple[bool, Op
         >>> validate_read_only_sql("DELETE FROM table WHERE id = 1")
         (False, "SQL contains destructive operation 'DELETE'. ...")
     """
+    # Fast path: an ASCII read statement that mentions no destructive keyword
+    # anywhere (even inside a word) cannot fail the checks below
+    if sql.isascii():
+        upper_sql = sql.upper()
+        if not any(keyword in upper_sql for keyword in DESTRUCTIVE_KEYWORDS):
+            leading = _LEADING_VERB_RE.match(upper_sql)
+            if leading and leading.group(1) in _SAFE_LEADING_VERBS:
+                return True, None
+
     # Normalize SQL: remove comments and extra whitespace
     normalized_sql = _normalize_sql(sql)
 
     # Check for destructive keywords
-    keywords_to_check = DESTRUCTIVE_KEYWORDS if strict_mode else [
-        kw for kw in DESTRUCTIVE_KEYWORDS if kw not in CONDITIONAL_KEYWORDS
-    ]
+    keywords_to_check = DESTRUCTIVE_KEYWORDS if strict_mode else _NON_CONDITIONAL_KEYWORDS
 
+    # Scan once; report the first offending keyword in DESTRUCTIVE_KEYWORDS order
+    found = {match.group(1).upper() for match in _DESTRUCTIVE_KEYWORD_RE.finditer(normalized_sql)}
     for keyword in keywords_to_check:
-        if _contains_destructive_keyword(normalized_sql, keyword):
+        if keyword in found:
             error_msg = (
                 f"SQL contains potentially destructive operation '{keyword}'. "
                 f"This tool is designed for read-only queries (SELECT statements). "
@@ -81,14 +123,8 @@ def validate_read_only_sql(sql: str, strict_mode: bool = True) -> Tuple[bool, Op
             return False, error_msg
 
     # Additional checks for dangerous patterns
-    dangerous_patterns = [
-        (r";\s*DROP\s+", "Contains statement separator followed by DROP"),
-        (r";\s*DELETE\s+", "Contains statement separator followed by DELETE"),
-        (r";\s*TRUNCATE\s+", "Contains statement separator followed by TRUNCATE"),
-    ]
-
-    for pattern, description in dangerous_patterns:
-        if re.search(pattern, normalized_sql, re.IGNORECASE):
+    for pattern, description in _DANGEROUS_PATTERNS:
+        if pattern.search(normalized_sql):
             return False, f"SQL contains dangerous pattern: {description}"
 
     return True, None
@@ -105,77 +141,18 @@ def _normalize_sql(sql: str) -> str:
         Normalized SQL string
     """
     # Remove line comments (-- ...)
-    sql = re.sub(r"--[^\n]*", "", sql)
+    sql = _LINE_COMMENT_RE.sub("", sql)
 
     # Remove block comments (/* ... */)
-    sql = re.sub(r"/\*.*?\*/", "", sql, flags=re.DOTALL)
+    sql = _BLOCK_COMMENT_RE.sub("", sql)
 
     # Replace multiple whitespace with single space
-    sql = re.sub(r"\s+", " ", sql)
+    sql = _WHITESPACE_RE.sub(" ", sql)
 
     # Trim
     return sql.strip()
 
 
-def _contains_destructive_keyword(sql: str, keyword: str) -> bool:
-    """
-    Check if SQL contains a destructive keyword as a standalone operation.
-
-    This function attempts to distinguish between the keyword being used as
-    a main operation vs. being part of a subquery or column name.
-
-    Args:
-        sql: Normalized SQL string
-        keyword: Keyword to search for
-
-    Returns:
-        True if keyword is found as a main operation
-    """
-    # Create pattern that matches keyword as a whole word at statement boundaries
-    # This helps avoid false positives like "SELECT created_at" matching "CREATE"
-    pattern = rf"\b{keyword}\b"
-
-    matches = list(re.finditer(pattern, sql, re.IGNORECASE))
-
-    if not matches:
-        return False
-
-    # Check if any match is at a statement boundary (start of query or after semicolon)
-    for match in matches:
-        start_pos = match.start()
-
-        # Check what comes before the keyword
-        before = sql[:start_pos].strip()
-
-        # Keyword at start of query
-        if not before:
-            return True
-
-        # Keyword after semicolon (new statement)
-        if before.endswith(";"):
-            return True
-
-        # For keywords like CREATE, INSERT, allow in WITH clauses or subqueries
-        # but block at main statement level
-        if keyword in CONDITIONAL_KEYWORDS:
-            # Check if we're inside parentheses (subquery)
-            open_parens = before.count("(")
-            close_parens = before.count(")")
-            if open_parens > close_parens:
-                # We're inside a subquery, might be okay
-                continue
-
-            # Check for WITH clause
-            if re.search(r"\bWITH\b", before, re.IGNORECASE):
-                continue
-
-            # Otherwise, it's a main statement
-            return True
-
-    # If we got here and keyword was found, it's likely destructive
-    return len(matches) > 0
-
-
 def suggest_safe_alternative(sql: str, error_message: str) -> str:
     """
     Suggest a safe alternative to a rejected SQL query.
@@ -188,30 +165,10 @@ def suggest_safe_alternative(sql: str, error_message: str) -> str:
         Helpful suggestion for the user
     """
     sql_upper = sql.upper()
-
-    suggestions = []
-
-    if "DROP" in sql_upper:
-        suggestions.append(
-            "Instead of DROP, use SELECT to query the table structure: "
-            "DESCRIBE TABLE or SHOW COLUMNS FROM"
-        )
-
-    if "DELETE" in sql_upper or "TRUNCATE" in sql_upper:
-        suggestions.append(
-            "Instead of deleting data, use SELECT with WHERE clause to view the data you want to remove"
-        )
-
-    if "UPDATE" in sql_upper:
-        suggestions.append(
-            "Instead of UPDATE, use SELECT to view the data you want to modify"
-        )
-
-    if "INSERT" in sql_upper:
-        suggestions.append(
-            "Instead of INSERT, use SELECT to query existing data. "
-            "If you need to insert data, use a separate write-enabled tool."
-        )
+    suggestions = [
+        suggestion for keywords, suggestion in _SUGGESTIONS
+        if any(keyword in sql_upper for keyword in keywords)
+    ]
 
     if suggestions:
         return "\n\nSuggestions:\n- " + "\n- ".join(suggestions)
@@ -259,8 +216,8 @@ def sanitize_sql_for_logging(sql: str, max_length: int = 200) -> str:
         Sanitized SQL string safe for logging
     """
     # Remove potential sensitive data patterns
-    sanitized = re.sub(r"'[^']*'", "'***'", sql)  # Replace string literals
-    sanitized = re.sub(r'"[^"]*"', '"***"', sanitized)  # Replace quoted identifiers
+    sanitized = _STRING_LITERAL_RE.sub("'***'", sql)  # Replace string literals
+    sanitized = _QUOTED_IDENTIFIER_RE.sub('"***"', sanitized)  # Replace quoted identifiers
 
     # Truncate if too long
     if len(sanitized) > max_length:
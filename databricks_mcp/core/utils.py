@@ -2,14 +2,49 @@
 Utility functions for the Databricks MCP server.
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 from httpx import HTTPError
 
-from databricks_mcp.core.config import get_api_headers, get_databricks_api_url
+from databricks_mcp.core.config import get_api_headers, get_databricks_api_url, settings
+
+# msgspec is optional; it enables typed decoding via make_api_request(response_type=...)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Use orjson for JSON parsing and serialization when available, but don't
+# require it. Both parsers raise a ValueError subclass on malformed input.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces int keys to strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    json_loads = json.loads
+
+    if msgspec is not None:
+        # One encoder reused for every call; it also accepts int keys
+        _json_encode = msgspec.json.Encoder().encode
+
+        def json_dumps(obj: Any) -> str:
+            """Serialize obj to a compact JSON string."""
+            return _json_encode(obj).decode()
+    else:
+        json_dumps = functools.partial(json.dumps, separators=(",", ":"))
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +53,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Generous enough for SQL statements submitted with a server-side wait_timeout
+REQUEST_TIMEOUT_SECONDS = 60.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+REQUEST_TIMEOUT = httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS)
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+
+# Shared client, bound to the event loop that created it, and the semaphore
+# that caps concurrent requests through it (asyncio primitives are per loop too)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
 
 class DatabricksAPIError(Exception):
     """Exception raised for errors in the Databricks API."""
@@ -29,12 +84,68 @@ class DatabricksAPIError(Exception):
         super().__init__(self.message)
 
 
+def _retire_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client left behind by another event loop, as far as that loop allows."""
+    if client.is_closed or loop is None:
+        return
+    if loop.is_running():
+        # Still serving another thread; close the pool there
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    # A stopped or closed loop cannot run aclose(); dropping the last
+    # reference lets its sockets be closed on garbage collection
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used for Databricks API requests.
+
+    The client keeps connections alive between requests so pollers and
+    back-to-back tool calls don't pay a TCP/TLS handshake each time. A new
+    client is created if the previous one was closed or belongs to another
+    event loop; a client replaced that way is closed if its loop still runs.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client, _client_loop, _request_semaphore
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and _client_loop is not loop:
+            _retire_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=REQUEST_TIMEOUT,
+            limits=CONNECTION_LIMITS,
+        )
+        _client_loop = loop
+        _request_semaphore = asyncio.Semaphore(settings.DATABRICKS_MAX_CONCURRENCY)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client if one is open, dropping its semaphore too."""
+    global _client, _client_loop, _request_semaphore
+
+    client, client_loop = _client, _client_loop
+    _client = None
+    _client_loop = None
+    _request_semaphore = None
+    if client is None or client.is_closed:
+        return
+    if client_loop is asyncio.get_running_loop():
+        await client.aclose()
+    else:
+        _retire_client(client, client_loop)
+
+
 async def make_api_request(
     method: str,
     endpoint: str,
     data: Optional[Dict[str, Any]] = None,
     params: Optional[Dict[str, Any]] = None,
     files: Optional[Dict[str, Any]] = None,
+    response_type: Optional[type] = None,
 ) -> Dict[str, Any]:
     """
     Make a request to the Databricks API.
@@ -45,6 +156,8 @@ async def make_api_request(
         data: Request body data
         params: Query parameters
         files: Files to upload
+        response_type: Optional msgspec Struct to decode the response into. Only
+            the fields it declares are returned. Ignored if msgspec is not installed.
         
     Returns:
         Response data as a dictionary
@@ -59,7 +172,8 @@ async def make_api_request(
         safe_data = "**REDACTED**" if data else None
         logger.debug("API Request: %s %s Params: %s Data: %s", method, url, params, safe_data)
 
-        async with httpx.AsyncClient() as client:
+        client = get_client()
+        async with _request_semaphore:
             response = await client.request(
                 method=method,
                 url=url,
@@ -72,9 +186,13 @@ async def make_api_request(
 
         response.raise_for_status()
 
-        if response.content:
-            return response.json()
-        return {}
+        content = response.content
+        if not content:
+            return {}
+        if response_type is not None and msgspec is not None:
+            return msgspec.to_builtins(msgspec.json.decode(content, type=response_type))
+        # Parse the raw bytes; response.json() would decode to str first
+        return json_loads(content)
 
     except HTTPError as e:
         status_code = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
@@ -83,7 +201,7 @@ async def make_api_request(
         error_response = None
         if hasattr(e, "response") and e.response is not None:
             try:
-                error_response = e.response.json()
+                error_response = json_loads(e.response.content)
                 error_msg = f"{error_msg} - {error_response.get('error', '')}"
             except ValueError:
                 error_response = e.response.text
@@ -93,6 +211,110 @@ async def make_api_request(
         raise DatabricksAPIError(error_msg, status_code, error_response) from e
 
 
+def async_ttl_cache(ttl: float = 10, maxsize: int = 64) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache results of an async function for a short time.
+
+    Entries are keyed on the bound call arguments and evicted least recently
+    used once ``maxsize`` is reached. Identical concurrent calls share one
+    in-flight request. The wrapped function gains ``invalidate(*args,
+    **kwargs)`` to drop a single entry and ``cache_clear()`` to drop all of
+    them; mutating API calls use these to drop the listings they affect.
+    Changes made outside those calls stay invisible for up to ``ttl``
+    seconds, so keep it short for data users expect to see change. A
+    request already in flight when either runs
+    still answers its callers but is not cached, since it may predate the
+    change. Callers share the returned object, so it must not be mutated.
+
+    Args:
+        ttl: Seconds to keep a result
+        maxsize: Maximum number of cached entries
+
+    Returns:
+        Decorator for an async function with hashable arguments
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+        cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        # Bumped by invalidate/cache_clear; results of requests started
+        # under an older generation are not stored
+        generation = 0
+
+        def make_key(*args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())
+
+        def store(key: Tuple[Any, ...], started: int, task: asyncio.Future) -> None:
+            if inflight.get(key) is task:
+                del inflight[key]
+            if task.cancelled() or task.exception() is not None or started != generation:
+                return
+            cache[key] = (time.monotonic() + ttl, task.result())
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(*args, **kwargs)
+
+            cached = cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return cached[1]
+                del cache[key]
+
+            task = inflight.get(key)
+            # A request left over from a closed event loop can never finish here
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(functools.partial(store, key, generation))
+            return await asyncio.shield(task)
+
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            nonlocal generation
+            generation += 1
+            key = make_key(*args, **kwargs)
+            cache.pop(key, None)
+            inflight.pop(key, None)
+
+        def cache_clear() -> None:
+            nonlocal generation
+            generation += 1
+            cache.clear()
+            inflight.clear()
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def singleflight(ttl: float = 0.5, maxsize: int = 256) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Coalesce identical concurrent calls to an async function.
+
+    While a call is in flight, further calls with the same arguments await
+    the same result instead of issuing another request. Successful results
+    are reused for ``ttl`` seconds. This is ``async_ttl_cache`` with a
+    short TTL, so it shares its in-flight handling. Callers share the
+    returned object, so it must not be mutated.
+
+    Args:
+        ttl: Seconds to keep a successful result
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Decorator for an async function with hashable arguments
+    """
+    return async_ttl_cache(ttl=ttl, maxsize=maxsize)
+
+
 def format_response(
     success: bool, 
     data: Optional[Union[Dict[str, Any], List[Any]]] = None, 
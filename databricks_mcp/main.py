@@ -43,8 +43,8 @@ async def main():
     
     # Log startup information
     logger = logging.getLogger(__name__)
-    logger.info(f"Starting Databricks MCP server v{settings.VERSION}")
-    logger.info(f"Databricks host: {settings.DATABRICKS_HOST}")
+    logger.info("Starting Databricks MCP server v%s", settings.VERSION)
+    logger.info("Databricks host: %s", settings.DATABRICKS_HOST)
     
     # Start the MCP server
     await start_mcp_server()
@@ -3,8 +3,16 @@ Main entry point for running the server module directly.
 This allows the module to be run with 'python -m databricks_mcp.server' or 'uv run databricks_mcp.server'.
 """
 
-import asyncio
 from databricks_mcp.server.databricks_mcp_server import main
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
+    # main() is synchronous: FastMCP.run() starts its own event loop, which
+    # picks up the uvloop policy when it is installed.
+    if uvloop is not None:
+        uvloop.install()
+    main()
@@ -7,18 +7,22 @@ via stdio and directly connecting to Databricks when tools are invoked.
 """
 
 import asyncio
-import json
+import atexit
+import base64
 import logging
-import sys
-import os
-from typing import Any, Dict, List, Optional, Union, cast
+import queue
+from contextlib import suppress
+from functools import lru_cache
+from json.encoder import encode_basestring
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from mcp.server import FastMCP
 from mcp.types import TextContent
-from mcp.server.stdio import stdio_server
 
-from databricks_mcp.api import clusters, dbfs, jobs, notebooks, sql, libraries, repos, unity_catalog, genie
+from databricks_mcp.api import clusters, dbfs, jobs, notebooks, libraries, repos, unity_catalog, genie
 from databricks_mcp.core.config import settings
+from databricks_mcp.core.utils import close_client, json_dumps
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +32,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+__all__ = ["DatabricksMCPServer", "main"]
+
+
+def _start_log_listener() -> QueueListener:
+    """
+    Move the root logger's handlers onto a background thread.
+
+    Tool handlers log from the event loop; with the handlers behind a queue a
+    log call only enqueues the record, and the file/stream writes happen on
+    the listener thread instead of stalling other requests.
+
+    Returns:
+        The started listener, stopped at interpreter exit
+    """
+    root = logging.getLogger()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+_log_listener = _start_log_listener()
+
 
 def _unwrap_params(params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -44,9 +73,221 @@ def _unwrap_params(params: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Unwrapped parameters dictionary
     """
-    if 'params' in params and isinstance(params['params'], dict):
-        return params['params']
-    return params
+    # Runs on every tool call: one lookup, and an exact type check
+    inner = params.get('params')
+    return inner if type(inner) is dict else params
+
+
+def _text_content(payload: str) -> TextContent:
+    """
+    Wrap a serialized tool result as the tool's text content.
+
+    The payload is the text itself, so clients parse it with a single
+    json.loads. Building the TextContent here, without validation, lets
+    FastMCP pass it through instead of converting every item generically.
+
+    Args:
+        payload: JSON-encoded tool result
+
+    Returns:
+        TextContent carrying the payload
+    """
+    return TextContent.model_construct(type="text", text=payload)
+
+
+def _error_content(error: Exception) -> TextContent:
+    """
+    Build the error response for a failed tool call.
+
+    Args:
+        error: Exception raised by the tool
+
+    Returns:
+        TextContent carrying an {"error": message} payload
+    """
+    return TextContent.model_construct(type="text", text=_error_text(str(error)))
+
+
+@lru_cache(maxsize=256)
+def _error_text(message: str) -> str:
+    """
+    Serialize an error message into an {"error": message} payload.
+
+    Cached since failures tend to repeat verbatim (expired token, missing
+    cluster) while a tool keeps being retried.
+
+    Args:
+        message: Error message
+
+    Returns:
+        JSON-encoded error payload
+    """
+    return '{"error":' + encode_basestring(message) + '}'
+
+
+def _make_api_tool(
+    module: Any,
+    function_name: str,
+    arguments: Optional[Tuple[Union[str, Tuple[str, Any]], ...]],
+    action: str,
+) -> Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]:
+    """
+    Build a tool handler that forwards its parameters to one API function.
+
+    Args:
+        module: API module holding the function; looked up per call so
+            patched functions are honoured
+        function_name: Name of the API function in module
+        arguments: None to pass the unwrapped params dict itself, otherwise
+            parameter names, or (name, default) pairs, passed positionally
+        action: Lower-case description of the call for log messages
+
+    Returns:
+        Async tool handler
+    """
+    info_message = f"{action[0].upper()}{action[1:]} with params: %s"
+    error_message = f"Error {action}: %s"
+    specs = None if arguments is None else [
+        (argument, None) if isinstance(argument, str) else argument for argument in arguments
+    ]
+
+    async def handler(params: Dict[str, Any]) -> List[TextContent]:
+        logger.info(info_message, params)
+        try:
+            actual_params = _unwrap_params(params)
+            if specs is None:
+                args = [actual_params]
+            else:
+                args = [actual_params.get(key, default) for key, default in specs]
+            result = await getattr(module, function_name)(*args)
+            return [_text_content(json_dumps(result))]
+        except Exception as e:
+            logger.error(error_message, e)
+            return [_error_content(e)]
+
+    return handler
+
+
+# Tools that forward their parameters to a single API call:
+# (name, description, action for log messages, API module, function name, arguments)
+_API_TOOLS = (
+    # Cluster management tools
+    ("list_clusters", "List all Databricks clusters",
+     "listing clusters", clusters, "list_clusters", ()),
+    ("create_cluster", "Create a new Databricks cluster with parameters: cluster_name (required), spark_version (required), node_type_id (required), num_workers, autotermination_minutes",
+     "creating cluster", clusters, "create_cluster", None),
+    ("terminate_cluster", "Terminate a Databricks cluster with parameter: cluster_id (required)",
+     "terminating cluster", clusters, "terminate_cluster", ("cluster_id",)),
+    ("get_cluster", "Get information about a specific Databricks cluster with parameter: cluster_id (required)",
+     "getting cluster info", clusters, "get_cluster", ("cluster_id",)),
+    ("start_cluster", "Start a terminated Databricks cluster with parameter: cluster_id (required)",
+     "starting cluster", clusters, "start_cluster", ("cluster_id",)),
+    # Job management tools
+    ("list_jobs", "List all Databricks jobs",
+     "listing jobs", jobs, "list_jobs", ()),
+    ("create_job", "Create a Databricks job. Provide name and tasks list.",
+     "creating job", jobs, "create_job", None),
+    ("delete_job", "Delete a Databricks job with parameter: job_id",
+     "deleting job", jobs, "delete_job", ("job_id",)),
+    ("run_job", "Run a Databricks job with parameters: job_id (required), notebook_params (optional)",
+     "running job", jobs, "run_job", ("job_id", ("notebook_params", {}))),
+    ("run_notebook", "Submit a one-time notebook run with parameters: notebook_path (required), existing_cluster_id (optional), base_parameters (optional)",
+     "running notebook", jobs, "run_notebook", ("notebook_path", "existing_cluster_id", "base_parameters")),
+    ("run_notebook_with_context", "Submit a one-time notebook run and also return the cluster's library status with parameters: notebook_path (required), existing_cluster_id (optional), base_parameters (optional)",
+     "running notebook with context", jobs, "run_notebook_with_context", ("notebook_path", "existing_cluster_id", "base_parameters")),
+    ("get_run_status", "Get status for a job run with parameter: run_id",
+     "getting run status", jobs, "get_run_status", ("run_id",)),
+    ("list_job_runs", "List recent runs for a job with parameter: job_id",
+     "listing job runs", jobs, "list_runs", ("job_id",)),
+    ("cancel_run", "Cancel a job run with parameter: run_id",
+     "cancelling run", jobs, "cancel_run", ("run_id",)),
+    # Notebook management tools
+    ("list_notebooks", "List notebooks in a workspace directory with parameter: path (required)",
+     "listing notebooks", notebooks, "list_notebooks", ("path",)),
+    ("import_notebook", "Import a notebook; parameters: path, content (base64 or text), format (optional)",
+     "importing notebook", notebooks, "import_notebook", ("path", "content", ("format", "SOURCE"))),
+    ("delete_workspace_object", "Delete a notebook or directory with parameters: path, recursive (optional)",
+     "deleting workspace object", notebooks, "delete_notebook", ("path", ("recursive", False))),
+    # DBFS tools
+    ("list_files", "List files and directories in a DBFS path with parameter: dbfs_path (required)",
+     "listing files", dbfs, "list_files", ("dbfs_path",)),
+    ("dbfs_delete", "Delete a file or directory in DBFS with parameters: dbfs_path, recursive (optional)",
+     "deleting DBFS path", dbfs, "delete_file", ("dbfs_path", ("recursive", False))),
+    ("pull_repo", "Pull the latest commit for a repo with parameter: repo_id (required)",
+     "pulling repo", repos, "pull_repo", ("repo_id",)),
+    # SQL tools
+    ("execute_sql", "Execute a SQL statement with parameters: statement (required), warehouse_id (optional - uses DATABRICKS_WAREHOUSE_ID env var if not provided), catalog (optional), schema (optional)",
+     "executing SQL", unity_catalog, "execute_sql", ("statement", "warehouse_id", "catalog", "schema")),
+    # Cluster library tools
+    ("install_library", "Install a library on a cluster with parameters: cluster_id, libraries",
+     "installing library", libraries, "install_library", ("cluster_id", ("libraries", []))),
+    ("uninstall_library", "Uninstall a library from a cluster with parameters: cluster_id, libraries",
+     "uninstalling library", libraries, "uninstall_library", ("cluster_id", ("libraries", []))),
+    ("list_cluster_libraries", "List library status for a cluster with parameter: cluster_id",
+     "listing cluster libraries", libraries, "list_cluster_libraries", ("cluster_id",)),
+    # Repos tools
+    ("create_repo", "Create or clone a repo with parameters: url, provider, branch (optional)",
+     "creating repo", repos, "create_repo", ("url", "provider", "branch", "path")),
+    ("update_repo", "Update repo branch with parameters: repo_id, branch or tag",
+     "updating repo", repos, "update_repo", ("repo_id", "branch", "tag")),
+    ("list_repos", "List repos with optional path_prefix",
+     "listing repos", repos, "list_repos", ("path_prefix",)),
+    # Unity Catalog tools
+    ("list_catalogs", "List catalogs in Unity Catalog",
+     "listing catalogs", unity_catalog, "list_catalogs", ()),
+    ("create_catalog", "Create a catalog with parameters: name, comment",
+     "creating catalog", unity_catalog, "create_catalog", ("name", "comment")),
+    ("list_schemas", "List schemas for a catalog with parameter: catalog_name",
+     "listing schemas", unity_catalog, "list_schemas", ("catalog_name",)),
+    ("create_schema", "Create schema with parameters: catalog_name, name, comment",
+     "creating schema", unity_catalog, "create_schema", ("catalog_name", "name", "comment")),
+    ("list_tables", "List tables with parameters: catalog_name, schema_name",
+     "listing tables", unity_catalog, "list_tables", ("catalog_name", "schema_name")),
+    ("create_table", "Create table via SQL with parameters: warehouse_id, statement",
+     "creating table", unity_catalog, "create_table", ("warehouse_id", "statement")),
+    ("create_tables_batch", "Run several CREATE TABLE/DDL statements in one SQL call with parameters: warehouse_id, statements (list)",
+     "creating tables", unity_catalog, "create_tables_batch", ("warehouse_id", ("statements", []))),
+    ("get_table_lineage", "Get table lineage with parameter: full_name",
+     "getting lineage", unity_catalog, "get_table_lineage", ("full_name",)),
+    ("list_catalog_tree", "List all catalogs with their schemas and table names in one call; prefer this to walking list_catalogs, list_schemas and list_tables. Parameters: max_schemas (optional, default: 100, schemas whose tables are listed), max_tables (optional, default: 1000 per schema)",
+     "listing catalog tree", unity_catalog, "list_catalog_tree", (("max_schemas", 100), ("max_tables", 1000))),
+    ("refresh_catalog_cache", "Drop cached Unity Catalog listings (catalogs, schemas, tables, lineage) so changes made outside this server show up immediately",
+     "refreshing catalog cache", unity_catalog, "clear_cache", ()),
+    # Genie AI tools
+    ("list_genie_spaces", "List all available Genie AI spaces in the workspace",
+     "listing Genie spaces", genie, "list_genie_spaces", ()),
+    ("start_genie_conversation", "Start a new conversation with Genie AI. Parameters: space_id (required), question (required), wait_for_result (optional, default: true), include_raw_attachments (optional, default: false), max_wait (optional, default: %d seconds). If the answer is not ready within max_wait, returns conversation_id and message_id with status PENDING; poll them with get_genie_message_status" % genie.GENIE_TOOL_MAX_WAIT,
+     "starting Genie conversation", genie, "start_conversation",
+     ("space_id", "question", ("wait_for_result", True), ("include_raw_attachments", False),
+      ("max_wait", genie.GENIE_TOOL_MAX_WAIT))),
+    ("send_genie_followup", "Send a follow-up message in an existing Genie conversation. Parameters: space_id (required), conversation_id (required), question (required), wait_for_result (optional, default: true), include_raw_attachments (optional, default: false), max_wait (optional, default: %d seconds). If the answer is not ready within max_wait, returns message_id with status PENDING; poll it with get_genie_message_status" % genie.GENIE_TOOL_MAX_WAIT,
+     "sending Genie follow-up", genie, "send_followup_message",
+     ("space_id", "conversation_id", "question", ("wait_for_result", True), ("include_raw_attachments", False),
+      ("max_wait", genie.GENIE_TOOL_MAX_WAIT))),
+    ("get_genie_message_status", "Get the status of a Genie message. Parameters: space_id (required), conversation_id (required), message_id (required)",
+     "getting Genie message status", genie, "get_message_status", ("space_id", "conversation_id", "message_id")),
+    ("get_genie_messages_status_batch", "Get the status of several Genie messages in one call; preferred over repeated get_genie_message_status calls when polling more than one message. Parameters: messages (required, list of {space_id, conversation_id, message_id}). Returns a map of message_id to status",
+     "getting Genie message statuses", genie, "get_messages_status", (("messages", []),)),
+    ("get_genie_query_results", "Get query results from a Genie message. Parameters: space_id (required), conversation_id (required), message_id (required), attachment_id (required)",
+     "getting Genie query results", genie, "get_query_results",
+     ("space_id", "conversation_id", "message_id", "attachment_id")),
+)
+
+
+async def _prewarm_caches() -> None:
+    """
+    Fill the catalog listing cache in the background.
+
+    Runs while the client is still initializing, so the first list_catalogs
+    call is usually served from cache. Only listings cached for longer than
+    startup takes are worth fetching; the Genie space listing would expire
+    before it is asked for. A failure is logged as a warning, since it
+    usually means the host or token is wrong.
+    """
+    try:
+        await unity_catalog.list_catalogs()
+    except Exception as e:
+        logger.warning("Cache pre-warm request failed: %s", e)
 
 
 class DatabricksMCPServer(FastMCP):
@@ -58,165 +299,37 @@ class DatabricksMCPServer(FastMCP):
         super().__init__(name="databricks-mcp",
                          instructions="Use this server to manage Databricks resources")
         logger.info("Initializing Databricks MCP server")
-        logger.info(f"Databricks host: {settings.DATABRICKS_HOST}")
+        logger.info("Databricks host: %s", settings.DATABRICKS_HOST)
         
         # Register tools
         self._register_tools()
+
+    async def run_stdio_async(self) -> None:
+        """Serve over stdio, closing the shared HTTP client on shutdown."""
+        prewarm = asyncio.ensure_future(_prewarm_caches()) if settings.PREWARM_CACHES else None
+        try:
+            await super().run_stdio_async()
+        finally:
+            if prewarm is not None:
+                prewarm.cancel()
+                with suppress(asyncio.CancelledError):
+                    await prewarm
+            await close_client()
     
     def _register_tools(self):
         """Register all Databricks MCP tools."""
-        
-        # Cluster management tools
-        @self.tool(
-            name="list_clusters",
-            description="List all Databricks clusters",
-        )
-        async def list_clusters(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing clusters with params: {params}")
-            try:
-                result = await clusters.list_clusters()
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing clusters: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="create_cluster",
-            description="Create a new Databricks cluster with parameters: cluster_name (required), spark_version (required), node_type_id (required), num_workers, autotermination_minutes",
-        )
-        async def create_cluster(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating cluster with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await clusters.create_cluster(actual_params)
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating cluster: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="terminate_cluster",
-            description="Terminate a Databricks cluster with parameter: cluster_id (required)",
-        )
-        async def terminate_cluster(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Terminating cluster with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await clusters.terminate_cluster(actual_params.get("cluster_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error terminating cluster: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_cluster",
-            description="Get information about a specific Databricks cluster with parameter: cluster_id (required)",
-        )
-        async def get_cluster(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting cluster info with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await clusters.get_cluster(actual_params.get("cluster_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting cluster info: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="start_cluster",
-            description="Start a terminated Databricks cluster with parameter: cluster_id (required)",
-        )
-        async def start_cluster(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Starting cluster with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await clusters.start_cluster(actual_params.get("cluster_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error starting cluster: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        # Job management tools
-        @self.tool(
-            name="list_jobs",
-            description="List all Databricks jobs",
-        )
-        async def list_jobs(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing jobs with params: {params}")
-            try:
-                result = await jobs.list_jobs()
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing jobs: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="create_job",
-            description="Create a Databricks job. Provide name and tasks list.",
-        )
-        async def create_job_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating job with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.create_job(actual_params)
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating job: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="delete_job",
-            description="Delete a Databricks job with parameter: job_id",
-        )
-        async def delete_job_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting job with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.delete_job(actual_params.get("job_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting job: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="run_job",
-            description="Run a Databricks job with parameters: job_id (required), notebook_params (optional)",
-        )
-        async def run_job(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Running job with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                notebook_params = actual_params.get("notebook_params", {})
-                result = await jobs.run_job(actual_params.get("job_id"), notebook_params)
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error running job: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="run_notebook",
-            description="Submit a one-time notebook run with parameters: notebook_path (required), existing_cluster_id (optional), base_parameters (optional)",
-        )
-        async def run_notebook_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Running notebook with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.run_notebook(
-                    notebook_path=actual_params.get("notebook_path"),
-                    existing_cluster_id=actual_params.get("existing_cluster_id"),
-                    base_parameters=actual_params.get("base_parameters"),
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error running notebook: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+        for name, description, action, module, function_name, arguments in _API_TOOLS:
+            self.tool(name=name, description=description)(
+                _make_api_tool(module, function_name, arguments, action)
+            )
 
+        # Tools that do more than forward their parameters to one API call
         @self.tool(
             name="sync_repo_and_run_notebook",
             description="Pull a repo then run a notebook. Parameters: repo_id, notebook_path, existing_cluster_id (optional), base_parameters (optional)",
         )
         async def sync_repo_and_run_notebook(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Syncing repo and running notebook with params: {params}")
+            logger.info("Syncing repo and running notebook with params: %s", params)
             try:
                 actual_params = _unwrap_params(params)
                 await repos.pull_repo(actual_params.get("repo_id"))
@@ -225,312 +338,60 @@ class DatabricksMCPServer(FastMCP):
                     existing_cluster_id=actual_params.get("existing_cluster_id"),
                     base_parameters=actual_params.get("base_parameters"),
                 )
-                return [{"type": "text", "text": json.dumps(result)}]
+                return [_text_content(json_dumps(result))]
             except Exception as e:
-                logger.error(f"Error syncing repo and running notebook: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+                logger.error("Error syncing repo and running notebook: %s", e)
+                return [_error_content(e)]
 
-        @self.tool(
-            name="get_run_status",
-            description="Get status for a job run with parameter: run_id",
-        )
-        async def get_run_status(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting run status with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.get_run_status(actual_params.get("run_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting run status: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="list_job_runs",
-            description="List recent runs for a job with parameter: job_id",
-        )
-        async def list_job_runs(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing job runs with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.list_runs(actual_params.get("job_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing job runs: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="cancel_run",
-            description="Cancel a job run with parameter: run_id",
-        )
-        async def cancel_run_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Cancelling run with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await jobs.cancel_run(actual_params.get("run_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error cancelling run: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        # Notebook management tools
-        @self.tool(
-            name="list_notebooks",
-            description="List notebooks in a workspace directory with parameter: path (required)",
-        )
-        async def list_notebooks(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing notebooks with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await notebooks.list_notebooks(actual_params.get("path"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing notebooks: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
         @self.tool(
             name="export_notebook",
-            description="Export a notebook from the workspace with parameters: path (required), format (optional, one of: SOURCE, HTML, JUPYTER, DBC)",
+            description="Export a notebook from the workspace with parameters: path (required), format (optional, one of: SOURCE, HTML, JUPYTER, DBC), include_raw_content (optional, default: false, also return the base64 content for SOURCE/JUPYTER, truncated to 1000 characters)",
         )
         async def export_notebook(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Exporting notebook with params: {params}")
+            logger.info("Exporting notebook with params: %s", params)
             try:
                 actual_params = _unwrap_params(params)
                 format_type = actual_params.get("format", "SOURCE")
-                result = await notebooks.export_notebook(actual_params.get("path"), format_type)
+                result = await notebooks.export_notebook(
+                    actual_params.get("path"), format_type, actual_params.get("include_raw_content", False)
+                )
                 
-                # For notebooks, we might want to trim the response for readability
+                # Trim the base64 content (HTML/DBC exports, or when requested) for readability
                 content = result.get("content", "")
-                if len(content) > 1000:
-                    summary = f"{content[:1000]}... [content truncated, total length: {len(content)} characters]"
-                    result["content"] = summary
+                content_length = len(content)
+                if content_length > 1000:
+                    result["content"] = (
+                        f"{content[:1000]}... [content truncated, total length: {content_length} characters]"
+                    )
+                del content  # don't hold the full export while serializing the summary
                 
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error exporting notebook: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="import_notebook",
-            description="Import a notebook; parameters: path, content (base64 or text), format (optional)",
-        )
-        async def import_notebook_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Importing notebook with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                path = actual_params.get("path")
-                content = actual_params.get("content")
-                fmt = actual_params.get("format", "SOURCE")
-                result = await notebooks.import_notebook(path, content, fmt)
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error importing notebook: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="delete_workspace_object",
-            description="Delete a notebook or directory with parameters: path, recursive (optional)",
-        )
-        async def delete_workspace_object(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting workspace object with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await notebooks.delete_notebook(
-                    actual_params.get("path"), actual_params.get("recursive", False)
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting workspace object: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        # DBFS tools
-        @self.tool(
-            name="list_files",
-            description="List files and directories in a DBFS path with parameter: dbfs_path (required)",
-        )
-        async def list_files(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing files with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await dbfs.list_files(actual_params.get("dbfs_path"))
-                return [{"type": "text", "text": json.dumps(result)}]
+                return [_text_content(json_dumps(result))]
             except Exception as e:
-                logger.error(f"Error listing files: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+                logger.error("Error exporting notebook: %s", e)
+                return [_error_content(e)]
 
         @self.tool(
             name="dbfs_put",
             description="Upload a small file to DBFS with parameters: dbfs_path, content_base64",
         )
         async def dbfs_put(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Uploading file to DBFS with params: {params}")
+            logger.info("Uploading file to DBFS with params: %s", params)
             try:
                 actual_params = _unwrap_params(params)
                 path = actual_params.get("dbfs_path")
-                content = actual_params.get("content_base64", "").encode()
-                import base64
-                data = base64.b64decode(content)
+                data = base64.b64decode(actual_params.get("content_base64", ""))
                 result = await dbfs.put_file(path, data)
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error uploading file: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="dbfs_delete",
-            description="Delete a file or directory in DBFS with parameters: dbfs_path, recursive (optional)",
-        )
-        async def dbfs_delete(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting DBFS path with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await dbfs.delete_file(actual_params.get("dbfs_path"), actual_params.get("recursive", False))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting file: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="pull_repo",
-            description="Pull the latest commit for a repo with parameter: repo_id (required)",
-        )
-        async def pull_repo_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Pulling repo with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await repos.pull_repo(actual_params.get("repo_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error pulling repo: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        # SQL tools
-        @self.tool(
-            name="execute_sql",
-            description="Execute a SQL statement with parameters: statement (required), warehouse_id (optional - uses DATABRICKS_WAREHOUSE_ID env var if not provided), catalog (optional), schema (optional)",
-        )
-        async def execute_sql(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Executing SQL with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                    
-                statement = actual_params.get("statement")
-                warehouse_id = actual_params.get("warehouse_id")
-                catalog = actual_params.get("catalog")
-                schema = actual_params.get("schema")
-                
-                result = await sql.execute_statement(
-                    statement=statement,
-                    warehouse_id=warehouse_id,
-                    catalog=catalog,
-                    schema=schema
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error executing SQL: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        # Cluster library tools
-        @self.tool(
-            name="install_library",
-            description="Install a library on a cluster with parameters: cluster_id, libraries",
-        )
-        async def install_library_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Installing library with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await libraries.install_library(actual_params.get("cluster_id"), actual_params.get("libraries", []))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error installing library: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="uninstall_library",
-            description="Uninstall a library from a cluster with parameters: cluster_id, libraries",
-        )
-        async def uninstall_library_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Uninstalling library with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await libraries.uninstall_library(actual_params.get("cluster_id"), actual_params.get("libraries", []))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error uninstalling library: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="list_cluster_libraries",
-            description="List library status for a cluster with parameter: cluster_id",
-        )
-        async def list_cluster_libraries_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing cluster libraries with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await libraries.list_cluster_libraries(actual_params.get("cluster_id"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing cluster libraries: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        # Repos tools
-        @self.tool(
-            name="create_repo",
-            description="Create or clone a repo with parameters: url, provider, branch (optional)",
-        )
-        async def create_repo_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating repo with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await repos.create_repo(
-                    actual_params.get("url"),
-                    actual_params.get("provider"),
-                    branch=actual_params.get("branch"),
-                    path=actual_params.get("path"),
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating repo: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="update_repo",
-            description="Update repo branch with parameters: repo_id, branch or tag",
-        )
-        async def update_repo_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating repo with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await repos.update_repo(
-                    actual_params.get("repo_id"),
-                    branch=actual_params.get("branch"),
-                    tag=actual_params.get("tag"),
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
+                return [_text_content(json_dumps(result))]
             except Exception as e:
-                logger.error(f"Error updating repo: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+                logger.error("Error uploading file: %s", e)
+                return [_error_content(e)]
 
-        @self.tool(
-            name="list_repos",
-            description="List repos with optional path_prefix",
-        )
-        async def list_repos_tool(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing repos with params: {params}")
-            try:
-                actual_params = _unwrap_params(params)
-                result = await repos.list_repos(actual_params.get("path_prefix"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing repos: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
-        # Workspace file tools
         @self.tool(
             name="get_workspace_file_content",
             description="Retrieve the content of a file from Databricks workspace with parameters: workspace_path (required), format (optional: SOURCE, HTML, JUPYTER, DBC - default SOURCE)",
         )
         async def get_workspace_file_content(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting workspace file content with params: {params}")
+            logger.info("Getting workspace file content with params: %s", params)
             try:
                 actual_params = _unwrap_params(params)
                     
@@ -542,18 +403,18 @@ class DatabricksMCPServer(FastMCP):
                 
                 # Use the workspace export API
                 result = await notebooks.export_workspace_file(workspace_path, format_type)
-                return [{"type": "text", "text": json.dumps(result)}]
+                return [_text_content(json_dumps(result))]
                 
             except Exception as e:
-                logger.error(f"Error getting workspace file content: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-        
+                logger.error("Error getting workspace file content: %s", e)
+                return [_error_content(e)]
+
         @self.tool(
             name="get_workspace_file_info",
             description="Get metadata about a workspace file with parameters: workspace_path (required)",
         )
         async def get_workspace_file_info(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting workspace file info with params: {params}")
+            logger.info("Getting workspace file info with params: %s", params)
             try:
                 actual_params = _unwrap_params(params)
 
@@ -563,168 +424,11 @@ class DatabricksMCPServer(FastMCP):
                     raise ValueError("workspace_path is required")
 
                 result = await notebooks.get_workspace_file_info(workspace_path)
-                return [{"type": "text", "text": json.dumps(result)}]
-
-            except Exception as e:
-                logger.error(f"Error getting workspace file info: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        # Unity Catalog tools
-        @self.tool(name="list_catalogs", description="List catalogs in Unity Catalog")
-        async def list_catalogs_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                result = await unity_catalog.list_catalogs()
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing catalogs: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(name="create_catalog", description="Create a catalog with parameters: name, comment")
-        async def create_catalog_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.create_catalog(actual_params.get("name"), actual_params.get("comment"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating catalog: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(name="list_schemas", description="List schemas for a catalog with parameter: catalog_name")
-        async def list_schemas_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.list_schemas(actual_params.get("catalog_name"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing schemas: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(name="create_schema", description="Create schema with parameters: catalog_name, name, comment")
-        async def create_schema_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.create_schema(
-                    actual_params.get("catalog_name"), actual_params.get("name"), actual_params.get("comment")
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating schema: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(name="list_tables", description="List tables with parameters: catalog_name, schema_name")
-        async def list_tables_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.list_tables(
-                    actual_params.get("catalog_name"), actual_params.get("schema_name")
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing tables: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+                return [_text_content(json_dumps(result))]
 
-        @self.tool(name="create_table", description="Create table via SQL with parameters: warehouse_id, statement")
-        async def create_table_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.create_table(actual_params.get("warehouse_id"), actual_params.get("statement"))
-                return [{"type": "text", "text": json.dumps(result)}]
             except Exception as e:
-                logger.error(f"Error creating table: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(name="get_table_lineage", description="Get table lineage with parameter: full_name")
-        async def get_table_lineage_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await unity_catalog.get_table_lineage(actual_params.get("full_name"))
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting lineage: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        # Genie AI tools
-        @self.tool(
-            name="list_genie_spaces",
-            description="List all available Genie AI spaces in the workspace"
-        )
-        async def list_genie_spaces_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                result = await genie.list_genie_spaces()
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing Genie spaces: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="start_genie_conversation",
-            description="Start a new conversation with Genie AI. Parameters: space_id (required), question (required), wait_for_result (optional, default: true)"
-        )
-        async def start_genie_conversation_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await genie.start_conversation(
-                    space_id=actual_params.get("space_id"),
-                    question=actual_params.get("question"),
-                    wait_for_result=actual_params.get("wait_for_result", True)
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error starting Genie conversation: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="send_genie_followup",
-            description="Send a follow-up message in an existing Genie conversation. Parameters: space_id (required), conversation_id (required), question (required), wait_for_result (optional, default: true)"
-        )
-        async def send_genie_followup_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await genie.send_followup_message(
-                    space_id=actual_params.get("space_id"),
-                    conversation_id=actual_params.get("conversation_id"),
-                    question=actual_params.get("question"),
-                    wait_for_result=actual_params.get("wait_for_result", True)
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error sending Genie follow-up: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="get_genie_message_status",
-            description="Get the status of a Genie message. Parameters: space_id (required), conversation_id (required), message_id (required)"
-        )
-        async def get_genie_message_status_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await genie.get_message_status(
-                    space_id=actual_params.get("space_id"),
-                    conversation_id=actual_params.get("conversation_id"),
-                    message_id=actual_params.get("message_id")
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting Genie message status: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
-
-        @self.tool(
-            name="get_genie_query_results",
-            description="Get query results from a Genie message. Parameters: space_id (required), conversation_id (required), message_id (required), attachment_id (required)"
-        )
-        async def get_genie_query_results_tool(params: Dict[str, Any]) -> List[TextContent]:
-            try:
-                actual_params = _unwrap_params(params)
-                result = await genie.get_query_results(
-                    space_id=actual_params.get("space_id"),
-                    conversation_id=actual_params.get("conversation_id"),
-                    message_id=actual_params.get("message_id"),
-                    attachment_id=actual_params.get("attachment_id")
-                )
-                return [{"type": "text", "text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting Genie query results: {str(e)}")
-                return [{"type": "text", "text": json.dumps({"error": str(e)})}]
+                logger.error("Error getting workspace file info: %s", e)
+                return [_error_content(e)]
 
 
 def main():
@@ -732,17 +436,15 @@ def main():
     try:
         logger.info("Starting Databricks MCP server")
         
-        # Turn off buffering in stdout
-        if hasattr(sys.stdout, 'reconfigure'):
-            sys.stdout.reconfigure(line_buffering=True)
-        
+        # stdout is left block-buffered: the stdio transport writes frames through
+        # its own wrapper around sys.stdout.buffer and flushes once per message
         server = DatabricksMCPServer()
         
         # Use the FastMCP run method which handles async internally
         server.run()
             
     except Exception as e:
-        logger.error(f"Error in Databricks MCP server: {str(e)}", exc_info=True)
+        logger.error("Error in Databricks MCP server: %s", e, exc_info=True)
         raise
 
 
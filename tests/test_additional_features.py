@@ -1,29 +1,169 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from databricks_mcp.api import libraries, repos, unity_catalog
 
 
 @pytest.mark.asyncio
-async def test_install_library():
-    libraries.install_library = AsyncMock(return_value={})
-    resp = await libraries.install_library("cluster", [])
-    assert resp == {}
-    libraries.install_library.assert_called_once()
+@pytest.mark.parametrize(
+    ("module", "name", "args", "result", "request_args"),
+    [
+        (
+            libraries,
+            "install_library",
+            ("cluster", []),
+            {},
+            (("POST", "/api/2.0/libraries/install"), {"data": {"cluster_id": "cluster", "libraries": []}}),
+        ),
+        (
+            repos,
+            "create_repo",
+            ("https://example.com", "git"),
+            {"id": 1},
+            (("POST", "/api/2.0/repos"), {"data": {"url": "https://example.com", "provider": "git"}}),
+        ),
+        (unity_catalog, "list_catalogs", (), {"catalogs": []}, (("GET", "/api/2.1/unity-catalog/catalogs"), {})),
+    ],
+)
+async def test_api_call(module, name, args, result, request_args):
+    # Listing calls are TTL-cached; start cold so the request is actually made
+    unity_catalog.list_catalogs.cache_clear()
+    target = f"{module.__name__}.make_api_request"
+    with patch(target, new=AsyncMock(return_value=result)) as mock_req:
+        resp = await getattr(module, name)(*args)
+
+    assert resp == result
+    positional, keywords = request_args
+    mock_req.assert_awaited_once_with(*positional, **keywords)
+
+
+@pytest.mark.asyncio
+async def test_create_tables_batch_submits_one_statement():
+    with patch("databricks_mcp.api.unity_catalog.sql.execute_statement", new=AsyncMock(return_value={})) as mock_exec:
+        await unity_catalog.create_tables_batch("w1", ["CREATE TABLE a (id INT);", "CREATE TABLE b (id INT)"])
+    mock_exec.assert_awaited_once_with(
+        "BEGIN\nCREATE TABLE a (id INT);\nCREATE TABLE b (id INT);\nEND", warehouse_id="w1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_tables_batch_drops_trailing_comments():
+    with patch("databricks_mcp.api.unity_catalog.sql.execute_statement", new=AsyncMock(return_value={})) as mock_exec:
+        await unity_catalog.create_tables_batch(
+            "w1", ["CREATE TABLE a (id INT) -- first", "CREATE TABLE b (note STRING DEFAULT '--'); -- second"]
+        )
+    mock_exec.assert_awaited_once_with(
+        "BEGIN\nCREATE TABLE a (id INT);\nCREATE TABLE b (note STRING DEFAULT '--');\nEND", warehouse_id="w1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_tables_batch_rejects_a_single_string():
+    with patch("databricks_mcp.api.unity_catalog.sql.execute_statement", new=AsyncMock()) as mock_exec:
+        with pytest.raises(ValueError, match="must be a list"):
+            await unity_catalog.create_tables_batch("w1", "CREATE TABLE a (id INT)")
+    mock_exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("statements", [[], ["", "  "], [" ; "]])
+async def test_create_tables_batch_rejects_empty_batches(statements):
+    with patch("databricks_mcp.api.unity_catalog.sql.execute_statement", new=AsyncMock()) as mock_exec:
+        with pytest.raises(ValueError, match="at least one statement"):
+            await unity_catalog.create_tables_batch("w1", statements)
+    mock_exec.assert_not_awaited()
+
+
+def test_table_url_quotes_name_but_keeps_dots():
+    assert unity_catalog.table_url("main.sales.q1 2024") == "/api/2.1/unity-catalog/tables/main.sales.q1%202024"
 
 
 @pytest.mark.asyncio
-async def test_create_repo():
-    repos.create_repo = AsyncMock(return_value={"id": 1})
-    resp = await repos.create_repo("https://example.com", "git")
-    assert resp["id"] == 1
-    repos.create_repo.assert_called_once()
+async def test_list_schemas_cached_until_create_schema():
+    unity_catalog.list_schemas.cache_clear()
+    with patch(
+        "databricks_mcp.api.unity_catalog.make_api_request",
+        new=AsyncMock(side_effect=[{"schemas": []}, {"name": "s"}, {"schemas": [{"name": "s"}]}]),
+    ) as mock_request:
+        assert await unity_catalog.list_schemas("main") == {"schemas": []}
+        assert await unity_catalog.list_schemas("main") == {"schemas": []}
+        await unity_catalog.create_schema("main", "s")
+        assert await unity_catalog.list_schemas("main") == {"schemas": [{"name": "s"}]}
+
+    assert mock_request.await_count == 3
 
 
 @pytest.mark.asyncio
-async def test_list_catalogs():
-    unity_catalog.list_catalogs = AsyncMock(return_value={"catalogs": []})
-    resp = await unity_catalog.list_catalogs()
-    assert resp["catalogs"] == []
-    unity_catalog.list_catalogs.assert_called_once()
+@pytest.mark.parametrize(("statement", "refetched"), [("CREATE SCHEMA main.s", True), ("  select 1", False)])
+async def test_execute_sql_drops_listings_unless_read_only(statement, refetched):
+    unity_catalog.list_schemas.cache_clear()
+    with (
+        patch("databricks_mcp.api.unity_catalog.make_api_request", new=AsyncMock(return_value={"schemas": []})) as mock_request,
+        patch("databricks_mcp.api.unity_catalog.sql.execute_statement", new=AsyncMock(return_value={})) as mock_exec,
+    ):
+        await unity_catalog.list_schemas("main")
+        await unity_catalog.execute_sql(statement, warehouse_id="w1")
+        await unity_catalog.list_schemas("main")
+
+    mock_exec.assert_awaited_once_with(statement, warehouse_id="w1", catalog=None, schema=None)
+    assert mock_request.await_count == (2 if refetched else 1)
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_refetches_listings():
+    unity_catalog.list_tables.cache_clear()
+    with patch(
+        "databricks_mcp.api.unity_catalog.make_api_request",
+        new=AsyncMock(side_effect=[{"tables": []}, {"tables": [{"name": "t"}]}]),
+    ) as mock_request:
+        assert await unity_catalog.list_tables("main", "s") == {"tables": []}
+        assert await unity_catalog.list_tables("main", "s") == {"tables": []}
+        await unity_catalog.clear_cache()
+        assert await unity_catalog.list_tables("main", "s") == {"tables": [{"name": "t"}]}
+
+    assert mock_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_catalog_tree_limits_schemas_and_reports_errors():
+    schemas = {"a": {"schemas": [{"name": "s1"}, {"name": "s2"}]}, "b": RuntimeError("denied")}
+
+    async def fake_schemas(catalog_name):
+        result = schemas[catalog_name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with (
+        patch("databricks_mcp.api.unity_catalog.list_catalogs",
+              new=AsyncMock(return_value={"catalogs": [{"name": "a"}, {"name": "b"}]})),
+        patch("databricks_mcp.api.unity_catalog.list_schemas", new=AsyncMock(side_effect=fake_schemas)),
+        patch("databricks_mcp.api.unity_catalog.list_tables",
+              new=AsyncMock(return_value={"tables": [{"name": "t1"}, {"name": "t2"}]})) as mock_tables,
+    ):
+        tree = await unity_catalog.list_catalog_tree(max_schemas=1, max_tables=5)
+
+    assert tree == {
+        "catalogs": [
+            {"name": "a", "schemas": [{"name": "s1", "tables": ["t1", "t2"]}, {"name": "s2"}]},
+            {"name": "b", "error": "denied"},
+        ],
+        "truncated": True,
+    }
+    mock_tables.assert_awaited_once_with("a", "s1")
+
+
+@pytest.mark.asyncio
+async def test_prewarm_caches_warns_on_failure():
+    from databricks_mcp.server import databricks_mcp_server
+
+    with (
+        patch("databricks_mcp.api.unity_catalog.list_catalogs", new=AsyncMock(side_effect=RuntimeError("down"))) as mock_catalogs,
+        patch("databricks_mcp.api.genie.list_genie_spaces", new=AsyncMock(return_value={"spaces": []})) as mock_spaces,
+        patch.object(databricks_mcp_server, "logger") as mock_logger,
+    ):
+        await databricks_mcp_server._prewarm_caches()
 
+    mock_catalogs.assert_awaited_once()
+    mock_spaces.assert_not_awaited()
+    mock_logger.warning.assert_called_once()
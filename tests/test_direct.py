@@ -42,30 +42,23 @@ async def test_list_clusters():
                 
                 # Parse the JSON from the text
                 try:
-                    # First level of parsing (the text is a JSON string)
+                    # The text is the JSON-encoded tool result
                     parsed_json = json.loads(text)
+                    logger.info(f"Parsed clusters data: {json.dumps(parsed_json, indent=2)}")
                     
-                    # Check if the parsed JSON has a 'text' field (double JSON encoding)
-                    if 'text' in parsed_json:
-                        # Second level of parsing (the text field is also a JSON string)
-                        inner_json = json.loads(parsed_json['text'])
-                        logger.info(f"Parsed clusters data: {json.dumps(inner_json, indent=2)}")
+                    # Extract cluster information
+                    if 'clusters' in parsed_json:
+                        clusters = parsed_json['clusters']
+                        logger.info(f"Found {len(clusters)} clusters")
                         
-                        # Extract cluster information
-                        if 'clusters' in inner_json:
-                            clusters = inner_json['clusters']
-                            logger.info(f"Found {len(clusters)} clusters")
-                            
-                            # Print information about each cluster
-                            for i, cluster in enumerate(clusters):
-                                logger.info(f"Cluster {i+1}:")
-                                logger.info(f"  ID: {cluster.get('cluster_id')}")
-                                logger.info(f"  Name: {cluster.get('cluster_name')}")
-                                logger.info(f"  State: {cluster.get('state')}")
-                            
-                            return True
-                    else:
-                        logger.info(f"Parsed JSON: {json.dumps(parsed_json, indent=2)}")
+                        # Print information about each cluster
+                        for i, cluster in enumerate(clusters):
+                            logger.info(f"Cluster {i+1}:")
+                            logger.info(f"  ID: {cluster.get('cluster_id')}")
+                            logger.info(f"  Name: {cluster.get('cluster_name')}")
+                            logger.info(f"  State: {cluster.get('state')}")
+                        
+                        return True
                         
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing JSON: {e}")
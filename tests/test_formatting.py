@@ -0,0 +1,43 @@
+"""
+Tests for the response formatting helpers.
+"""
+
+from databricks_mcp.core.formatting import (
+    CHARACTER_LIMIT,
+    DetailLevel,
+    ResponseFormat,
+    apply_truncation_if_needed,
+    format_catalogs_markdown,
+    format_timestamp,
+    trim_to_budget,
+)
+
+
+def test_trim_to_budget_keeps_items_until_estimate_overflows():
+    items = [{"name": "x" * 10, "comment": None} for _ in range(5)]
+
+    assert trim_to_budget(items, max_chars=25) == items[:3]
+    assert trim_to_budget(items, max_chars=100) is items
+
+
+def test_apply_truncation_appends_json_marker():
+    content = '{"items": [' + ", ".join(['{"name": "x"}'] * CHARACTER_LIMIT) + "]}"
+    result = apply_truncation_if_needed(content, ResponseFormat.JSON)
+
+    assert result == content[:CHARACTER_LIMIT] + '\n{"truncated": true}'
+
+
+def test_format_timestamp_is_utc():
+    assert format_timestamp(1700000000123) == "2023-11-14 22:13:20 UTC"
+    assert format_timestamp(None) == "N/A"
+    assert format_timestamp(10**30) == f"Invalid timestamp: {10**30}"
+
+
+def test_unrecognized_detail_level_falls_back_to_concise():
+    catalogs = [{"name": "main", "comment": "default", "owner": "admin"}]
+    concise = format_catalogs_markdown(catalogs)
+
+    assert format_catalogs_markdown(catalogs, "detailed") == format_catalogs_markdown(catalogs, DetailLevel.DETAILED)
+    assert "**Owner**" in format_catalogs_markdown(catalogs, "detailed")
+    assert format_catalogs_markdown(catalogs, "DETAILED") == concise
+    assert format_catalogs_markdown(catalogs, None) == concise
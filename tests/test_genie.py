@@ -0,0 +1,180 @@
+"""
+Tests for the Genie API polling helpers.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from databricks_mcp.api import genie
+
+
+@pytest.mark.asyncio
+async def test_poll_backs_off_between_status_checks():
+    statuses = [{"status": "PENDING"}, {"status": "EXECUTING_QUERY"}, {"status": "COMPLETED", "text": "done"}]
+    with (
+        patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(side_effect=statuses)),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        patch("databricks_mcp.api.genie._poll_hub", new=genie.GeniePollHub(poll_interval=1, max_poll_interval=2)),
+    ):
+        result = await genie._poll_for_message_completion("space", "conv", "msg", "q")
+
+    assert result["status"] == "COMPLETED"
+    assert result["response"] == "done"
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(delays) == 3
+    assert 1 <= delays[0] <= 1.1
+    assert 1.5 <= delays[1] <= 1.65
+    assert 2 <= delays[2] <= 2.2
+
+
+@pytest.mark.asyncio
+async def test_poll_hub_polls_concurrent_messages_together():
+    responses = {
+        "m1": [{"status": "PENDING"}, {"status": "COMPLETED", "id": "m1"}],
+        "m2": [{"status": "COMPLETED", "id": "m2"}],
+    }
+
+    async def fake_status(space_id, conversation_id, message_id):
+        return responses[message_id].pop(0)
+
+    hub = genie.GeniePollHub()
+    with (
+        patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(side_effect=fake_status)),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        first, second = await asyncio.gather(
+            hub.wait("space", "conv", "m1"),
+            hub.wait("space", "conv", "m2"),
+        )
+
+    assert first["id"] == "m1"
+    assert second["id"] == "m2"
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_honours_per_call_intervals():
+    statuses = [{"status": "PENDING"}, {"status": "COMPLETED", "text": "done"}]
+    with (
+        patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(side_effect=statuses)),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        patch("databricks_mcp.api.genie._poll_hub", new=genie.GeniePollHub()),
+    ):
+        await genie._poll_for_message_completion("space", "conv", "msg", "q", poll_interval=2, max_poll_interval=2.5)
+
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert 2 <= delays[0] <= 2.2
+    assert 2.5 <= delays[1] <= 2.75
+
+
+@pytest.mark.asyncio
+async def test_poll_hub_forgets_message_once_its_waiter_is_cancelled():
+    hub = genie.GeniePollHub(poll_interval=0.01, max_poll_interval=0.01)
+    with patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(return_value={"status": "PENDING"})):
+        waiter = asyncio.ensure_future(hub.wait("space", "conv", "msg"))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    assert hub._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_hub_extends_deadline_for_longer_waiter():
+    hub = genie.GeniePollHub()
+    first = hub.register("space", "conv", "msg", max_wait=1)
+    second = hub.register("space", "conv", "msg", max_wait=100)
+    entry = hub._pending[("space", "conv", "msg")]
+
+    assert first is second
+    assert entry.deadline - time.monotonic() > 50
+    for future in (first, second):
+        hub.release(("space", "conv", "msg"), future)
+    assert hub._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_fetches_attachment_results_concurrently():
+    status = {
+        "status": "COMPLETED",
+        "attachments": [
+            {"id": "a1", "query": {"query": "SELECT 1"}},
+            {"id": "a2"},
+        ],
+    }
+    fetch = AsyncMock(side_effect=[RuntimeError("boom"), {"data_array": [[1]]}])
+    with (
+        patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(return_value=status)),
+        patch("databricks_mcp.api.genie.get_query_results", new=fetch),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()),
+    ):
+        result = await genie._poll_for_message_completion("space", "conv", "msg", "q")
+
+    assert result["sql"] == "SELECT 1"
+    assert result["results"] == {"data_array": [[1]]}
+    assert fetch.await_count == 2
+    assert result["attachments"] == [{"id": "a1", "type": None}, {"id": "a2", "type": None}]
+
+
+@pytest.mark.asyncio
+async def test_poll_keeps_raw_attachments_when_requested():
+    attachments = [{"id": "a1", "type": "QUERY", "query": {"query": "SELECT 1"}}]
+    with (
+        patch("databricks_mcp.api.genie.get_message_status",
+              new=AsyncMock(return_value={"status": "COMPLETED", "attachments": attachments})),
+        patch("databricks_mcp.api.genie.get_query_results", new=AsyncMock(return_value={})),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()),
+    ):
+        result = await genie._poll_for_message_completion(
+            "space", "conv", "msg", "q", include_raw_attachments=True
+        )
+
+    assert result["attachments"] == attachments
+
+
+@pytest.mark.asyncio
+async def test_start_conversation_returns_pending_ids_after_max_wait():
+    with (
+        patch("databricks_mcp.api.genie.make_api_request",
+              new=AsyncMock(return_value={"conversation_id": "conv", "message_id": "msg"})),
+        patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(return_value={"status": "PENDING"})),
+        patch("databricks_mcp.api.genie.asyncio.sleep", new=AsyncMock()),
+        patch("databricks_mcp.api.genie._poll_hub", new=genie.GeniePollHub()),
+    ):
+        result = await genie.start_conversation("space", "q", max_wait=0)
+
+    assert result["status"] == "PENDING"
+    assert (result["conversation_id"], result["message_id"]) == ("conv", "msg")
+
+
+@pytest.mark.asyncio
+async def test_get_messages_status_maps_message_ids():
+    async def fake_status(space_id, conversation_id, message_id):
+        if message_id == "m2":
+            raise RuntimeError("gone")
+        if message_id == "m3":
+            raise asyncio.CancelledError()
+        return {"status": "COMPLETED", "id": message_id}
+
+    with patch("databricks_mcp.api.genie.get_message_status", new=AsyncMock(side_effect=fake_status)):
+        result = await genie.get_messages_status([
+            {"space_id": "s", "conversation_id": "c", "message_id": "m1"},
+            {"space_id": "s", "conversation_id": "c", "message_id": "m2"},
+            {"space_id": "s", "conversation_id": "c", "message_id": "m3"},
+        ])
+
+    assert result["messages"] == {
+        "m1": {"status": "COMPLETED", "id": "m1"},
+        "m2": {"error": "gone"},
+        "m3": {"error": "CancelledError"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_messages_status_rejects_empty_list():
+    with pytest.raises(ValueError, match="at least one message"):
+        await genie.get_messages_status([])
@@ -3,58 +3,52 @@ import pytest
 from unittest.mock import AsyncMock, patch
 
 from databricks_mcp.api import jobs, repos
+from databricks_mcp.core.utils import DatabricksAPIError
 from databricks_mcp.server.databricks_mcp_server import DatabricksMCPServer
 
 
-@pytest.mark.asyncio
-async def test_create_job():
-    jobs.create_job = AsyncMock(return_value={"job_id": 123})
-    payload = {"name": "Test", "tasks": []}
-
-    resp = await jobs.create_job(payload)
-
-    assert resp["job_id"] == 123
-    jobs.create_job.assert_called_once_with(payload)
+@pytest.fixture(scope="module")
+def server():
+    """One server for the module; registering every tool is the expensive part."""
+    return DatabricksMCPServer()
 
 
 @pytest.mark.asyncio
-async def test_delete_job():
-    jobs.delete_job = AsyncMock(return_value={})
-
-    resp = await jobs.delete_job(123)
-
-    assert resp == {}
-    jobs.delete_job.assert_called_once_with(123)
-
-
-@pytest.mark.asyncio
-async def test_list_runs():
-    jobs.list_runs = AsyncMock(return_value={"runs": []})
-
-    resp = await jobs.list_runs(123)
-
-    assert resp["runs"] == []
-    jobs.list_runs.assert_called_once_with(123)
-
-
-@pytest.mark.asyncio
-async def test_get_run_status():
-    jobs.get_run_status = AsyncMock(return_value={"state": "SUCCESS"})
-
-    resp = await jobs.get_run_status(1)
-
-    assert resp["state"] == "SUCCESS"
-    jobs.get_run_status.assert_called_once_with(1)
-
-
-@pytest.mark.asyncio
-async def test_cancel_run():
-    jobs.cancel_run = AsyncMock(return_value={})
-
-    resp = await jobs.cancel_run(5)
-
-    assert resp == {}
-    jobs.cancel_run.assert_called_once_with(5)
+@pytest.mark.parametrize(
+    ("name", "args", "response", "request_args", "result"),
+    [
+        (
+            "create_job",
+            ({"name": "Test", "tasks": []},),
+            {"job_id": 123},
+            (("POST", "/api/2.2/jobs/create"), {"data": {"name": "Test", "tasks": []}}),
+            {"job_id": 123},
+        ),
+        ("delete_job", (123,), {}, (("POST", "/api/2.2/jobs/delete"), {"data": {"job_id": 123}}), {}),
+        (
+            "list_runs",
+            (123,),
+            {"runs": []},
+            (("GET", "/api/2.1/jobs/runs/list"), {"params": {"limit": 20, "job_id": 123}}),
+            {"runs": []},
+        ),
+        (
+            "get_run_status",
+            (901,),
+            {"state": {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"}},
+            (("GET", "/api/2.1/jobs/runs/get"), {"params": {"run_id": 901}, "response_type": jobs.RunStateView}),
+            {"state": "SUCCESS", "life_cycle": "TERMINATED", "run_id": 901},
+        ),
+        ("cancel_run", (5,), {}, (("POST", "/api/2.1/jobs/runs/cancel"), {"data": {"run_id": 5}}), {}),
+    ],
+)
+async def test_jobs_api_call(name, args, response, request_args, result):
+    with patch("databricks_mcp.api.jobs.make_api_request", new=AsyncMock(return_value=response)) as mock_req:
+        resp = await getattr(jobs, name)(*args)
+
+    assert resp == result
+    positional, keywords = request_args
+    mock_req.assert_awaited_once_with(*positional, **keywords)
 
 
 @pytest.mark.asyncio
@@ -80,8 +74,7 @@ async def test_run_notebook():
 
 
 @pytest.mark.asyncio
-async def test_sync_repo_and_run_notebook_tool():
-    server = DatabricksMCPServer()
+async def test_sync_repo_and_run_notebook_tool(server):
     with (
         patch("databricks_mcp.api.repos.pull_repo", new=AsyncMock(return_value={"pulled": True})) as mock_pull,
         patch("databricks_mcp.api.jobs.run_notebook", new=AsyncMock(return_value={"run_id": 5})) as mock_run,
@@ -89,7 +82,67 @@ async def test_sync_repo_and_run_notebook_tool():
         res = await server.call_tool("sync_repo_and_run_notebook", {"params": {"repo_id": 1, "notebook_path": "/nb"}})
         assert isinstance(res, list)
         data = json.loads(res[0].text)
-        inner = json.loads(data["text"])
-        assert inner["run_id"] == 5
+        assert data["run_id"] == 5
         mock_pull.assert_awaited_once_with(1)
         mock_run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_table_driven_tools_forward_params_with_defaults(server):
+    with patch("databricks_mcp.api.jobs.run_job", new=AsyncMock(return_value={"run_id": 7})) as mock_run:
+        res = await server.call_tool("run_job", {"params": {"job_id": 3}})
+    assert json.loads(res[0].text) == {"run_id": 7}
+    mock_run.assert_awaited_once_with(3, {})
+
+    with patch("databricks_mcp.api.jobs.cancel_run", new=AsyncMock(side_effect=RuntimeError('no run "3"\n'))):
+        res = await server.call_tool("cancel_run", {"params": {"run_id": 3}})
+    assert json.loads(res[0].text) == {"error": 'no run "3"\n'}
+
+
+@pytest.mark.asyncio
+async def test_run_notebook_with_context():
+    with (
+        patch("databricks_mcp.api.jobs.submit_run", new=AsyncMock(return_value={"run_id": 7})),
+        patch("databricks_mcp.api.jobs.list_cluster_libraries", new=AsyncMock(return_value={"library_statuses": []})) as mock_libs,
+        patch("databricks_mcp.api.jobs.await_until_state", new=AsyncMock(return_value={})),
+        patch("databricks_mcp.api.jobs.get_run_output", new=AsyncMock(return_value={"result": "ok"})),
+    ):
+        output = await jobs.run_notebook_with_context("/Test", existing_cluster_id="c1")
+        assert output["run_id"] == 7
+        assert output["libraries"] == {"library_statuses": []}
+        mock_libs.assert_awaited_once_with("c1")
+
+
+@pytest.mark.asyncio
+async def test_run_notebook_with_context_tool_keeps_run_when_library_lookup_fails(server):
+    with (
+        patch("databricks_mcp.api.jobs.submit_run", new=AsyncMock(return_value={"run_id": 8})),
+        patch("databricks_mcp.api.jobs.list_cluster_libraries", new=AsyncMock(side_effect=DatabricksAPIError("forbidden"))),
+        patch("databricks_mcp.api.jobs.await_until_state", new=AsyncMock(return_value={})),
+        patch("databricks_mcp.api.jobs.get_run_output", new=AsyncMock(return_value={"result": "ok"})),
+    ):
+        res = await server.call_tool(
+            "run_notebook_with_context", {"params": {"notebook_path": "/Test", "existing_cluster_id": "c1"}}
+        )
+    output = json.loads(res[0].text)
+    assert output["run_id"] == 8
+    assert output["libraries"] == {"error": "forbidden"}
+
+
+@pytest.mark.asyncio
+async def test_await_until_state_stops_on_other_terminal_state():
+    state = {"state": {"life_cycle_state": "INTERNAL_ERROR"}}
+    with patch("databricks_mcp.api.jobs._get_run_state", new=AsyncMock(return_value=state)) as mock_state:
+        with pytest.raises(DatabricksAPIError, match="INTERNAL_ERROR"):
+            await jobs.await_until_state(3)
+        mock_state.assert_awaited_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_get_run_keeps_only_requested_fields():
+    run = {"run_id": 3, "state": {"life_cycle_state": "RUNNING"}, "tasks": [{"task_key": "t"}]}
+    with patch("databricks_mcp.api.jobs.make_api_request", new=AsyncMock(return_value=run)):
+        result = await jobs.get_run(3, fields="run_id, tasks")
+        state = await jobs.get_run(3, fields=" state ")
+    assert result == {"run_id": 3, "tasks": [{"task_key": "t"}]}
+    assert state == {"state": {"life_cycle_state": "RUNNING"}}
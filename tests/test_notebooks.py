@@ -0,0 +1,93 @@
+"""
+Tests for the notebooks API helpers.
+"""
+
+import base64
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from databricks_mcp.api import notebooks
+from databricks_mcp.server.databricks_mcp_server import DatabricksMCPServer
+
+
+def test_is_base64_accepts_encoded_content():
+    encoded = base64.b64encode(b"print('hello')\n").decode("utf-8")
+    assert notebooks.is_base64(encoded)
+
+
+def test_is_base64_rejects_plain_source():
+    assert not notebooks.is_base64("print('hello')")
+    assert not notebooks.is_base64("abc")
+    assert not notebooks.is_base64("café")
+
+
+def test_is_base64_accepts_wrapped_lines_but_not_uneven_text():
+    wrapped = base64.encodebytes(b"print('hello')\n" * 20).decode("ascii")
+    assert notebooks.is_base64(wrapped)
+    assert not notebooks.is_base64("1234\n56\n7890\n12\n")
+    assert not notebooks.is_base64("abcd" * 300_000 + "\nAB=C\n")
+
+
+@pytest.mark.asyncio
+async def test_export_workspace_file_sniffs_json():
+    content = base64.b64encode(b'  {"a": 1}').decode("utf-8")
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(return_value={"content": content})):
+        result = await notebooks.export_workspace_file("/file.json")
+
+    assert result["decoded_content"] == '  {"a": 1}'
+    assert result["content_type"] == "json"
+
+
+@pytest.mark.asyncio
+async def test_export_workspace_file_replaces_invalid_utf8():
+    content = base64.b64encode(b"\xff\xfeabc").decode("utf-8")
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(return_value={"content": content})):
+        result = await notebooks.export_workspace_file("/file.bin")
+
+    assert result["content_type"] == "text"
+    assert "encoding_warning" in result
+
+
+@pytest.mark.asyncio
+async def test_export_notebook_drops_raw_content_unless_requested():
+    content = base64.b64encode(b"print(1)").decode("utf-8")
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(side_effect=lambda *a, **k: {"content": content})):
+        dropped = await notebooks.export_notebook("/nb")
+        kept = await notebooks.export_notebook("/nb", include_raw_content=True)
+
+    assert "content" not in dropped
+    assert dropped["decoded_content"] == "print(1)"
+    assert kept["content"] == content
+
+
+@pytest.mark.asyncio
+async def test_export_notebook_keeps_content_that_is_not_utf8():
+    content = base64.b64encode(b"\xff\xfeabc").decode("utf-8")
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(return_value={"content": content})):
+        result = await notebooks.export_notebook("/nb")
+
+    assert result["content"] == content
+    assert "decoded_content" not in result
+
+
+@pytest.mark.asyncio
+async def test_export_notebook_tool_passes_include_raw_content_and_trims():
+    content = base64.b64encode(b"x" * 2000).decode("utf-8")
+    server = DatabricksMCPServer()
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(return_value={"content": content})):
+        res = await server.call_tool("export_notebook", {"params": {"path": "/nb", "include_raw_content": True}})
+
+    data = json.loads(res[0].text)
+    assert data["decoded_content"] == "x" * 2000
+    assert data["content"].endswith(f"[content truncated, total length: {len(content)} characters]")
+
+@pytest.mark.asyncio
+async def test_get_workspace_file_info_uses_get_status():
+    info = {"path": "/Users/me/file.py", "object_type": "FILE"}
+    with patch("databricks_mcp.api.notebooks.make_api_request", new=AsyncMock(return_value=info)) as mock_req:
+        result = await notebooks.get_workspace_file_info("/Users/me/file.py")
+
+    assert result == info
+    mock_req.assert_awaited_once_with("GET", "/api/2.0/workspace/get-status", params={"path": "/Users/me/file.py"})
@@ -0,0 +1,76 @@
+"""
+Tests for the SQL statement helpers.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from databricks_mcp.api import sql
+from databricks_mcp.core.formatting import format_sql_results_markdown
+from databricks_mcp.core.sql_safety import validate_read_only_sql
+from databricks_mcp.core.utils import DatabricksAPIError
+
+
+@pytest.mark.asyncio
+async def test_execute_and_wait_backs_off_between_polls():
+    submitted = {"statement_id": "s1", "status": {"state": "PENDING"}}
+    statuses = [{"status": {"state": "RUNNING"}}] * 3 + [{"status": {"state": "SUCCEEDED"}, "result": {}}]
+    with (
+        patch("databricks_mcp.api.sql.make_api_request", new=AsyncMock(return_value=submitted)) as mock_request,
+        patch("databricks_mcp.api.sql.get_statement_status", new=AsyncMock(side_effect=statuses)),
+        patch("databricks_mcp.api.sql.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        result = await sql.execute_and_wait("SELECT 1", warehouse_id="w1", max_poll_interval_seconds=0.3)
+
+    assert result["status"]["state"] == "SUCCEEDED"
+    assert mock_request.await_args.kwargs["data"]["wait_timeout"] == "50s"
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [0.1, 0.2, 0.3, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_execute_and_wait_skips_polling_when_submit_finishes():
+    submitted = {"statement_id": "s1", "status": {"state": "SUCCEEDED"}, "result": {}}
+    with (
+        patch("databricks_mcp.api.sql.make_api_request", new=AsyncMock(return_value=submitted)),
+        patch("databricks_mcp.api.sql.get_statement_status", new=AsyncMock()) as mock_status,
+    ):
+        result = await sql.execute_and_wait("SELECT 1", warehouse_id="w1")
+
+    assert result is submitted
+    mock_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_and_wait_raises_when_submit_fails():
+    submitted = {"statement_id": "s1", "status": {"state": "FAILED", "error": {"message": "bad column"}}}
+    with patch("databricks_mcp.api.sql.make_api_request", new=AsyncMock(return_value=submitted)):
+        with pytest.raises(DatabricksAPIError, match="bad column"):
+            await sql.execute_and_wait("SELECT x", warehouse_id="w1")
+
+
+@pytest.mark.asyncio
+async def test_execute_safe_statement_validates_repeated_sql_once():
+    sql._check_sql_safety_cached.cache_clear()
+    with (
+        patch("databricks_mcp.api.sql.check_sql_safety") as mock_check,
+        patch("databricks_mcp.api.sql.execute_statement", new=AsyncMock(return_value={})),
+    ):
+        await sql.execute_safe_statement("SELECT 1", warehouse_id="w1")
+        await sql.execute_safe_statement("SELECT 1", warehouse_id="w1")
+
+    mock_check.assert_called_once_with("SELECT 1", strict_mode=True)
+    sql._check_sql_safety_cached.cache_clear()
+
+
+def test_validate_read_only_sql_reports_first_listed_keyword():
+    assert validate_read_only_sql("SELECT created_at FROM t") == (True, None)
+
+    is_valid, message = validate_read_only_sql("UPDATE t SET a = 1; -- note\nDROP TABLE t")
+    assert not is_valid
+    assert "'DROP'" in message
+
+
+def test_results_markdown_truncates_long_cells():
+    markdown = format_sql_results_markdown(["a", "b", "c"], [["x" * 80, None, 3]])
+
+    assert f"| {'x' * 50} | NULL | 3 |" in markdown
@@ -31,10 +31,7 @@ async def test_list_clusters():
     
     # Parse the JSON data
     text = result[0].text
-    data = json.loads(text)
-    
-    assert 'text' in data, "Result should contain 'text' field"
-    inner_data = json.loads(data['text'])
+    inner_data = json.loads(text)
     
     assert 'clusters' in inner_data, "Result should contain 'clusters' field"
     logger.info(f"Found {len(inner_data['clusters'])} clusters")
@@ -56,10 +53,7 @@ async def test_list_notebooks():
     
     # Parse the JSON data
     text = result[0].text
-    data = json.loads(text)
-    
-    assert 'text' in data, "Result should contain 'text' field"
-    inner_data = json.loads(data['text'])
+    inner_data = json.loads(text)
     
     assert 'objects' in inner_data, "Result should contain 'objects' field"
     logger.info(f"Found {len(inner_data['objects'])} objects")
@@ -81,10 +75,7 @@ async def test_list_jobs():
     
     # Parse the JSON data
     text = result[0].text
-    data = json.loads(text)
-    
-    assert 'text' in data, "Result should contain 'text' field"
-    inner_data = json.loads(data['text'])
+    inner_data = json.loads(text)
     
     assert 'jobs' in inner_data, "Result should contain 'jobs' field"
     logger.info(f"Found {len(inner_data['jobs'])} jobs")
@@ -106,10 +97,7 @@ async def test_list_files():
     
     # Parse the JSON data
     text = result[0].text
-    data = json.loads(text)
-    
-    assert 'text' in data, "Result should contain 'text' field"
-    inner_data = json.loads(data['text'])
+    inner_data = json.loads(text)
     
     assert 'files' in inner_data, "Result should contain 'files' field"
     logger.info(f"Found {len(inner_data['files'])} files")
@@ -0,0 +1,114 @@
+"""
+Tests for the enhanced Unity Catalog helpers.
+"""
+
+import datetime
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from databricks_mcp.api import unity_catalog_enhanced
+from databricks_mcp.core.formatting import DetailLevel, ResponseFormat
+from databricks_mcp.core.utils import DatabricksAPIError
+
+
+@pytest.mark.asyncio
+async def test_describe_table_keeps_table_when_lineage_fails():
+    async def fake_request(method, endpoint, **kwargs):
+        if "lineage" in endpoint:
+            raise DatabricksAPIError("forbidden")
+        return {"full_name": "c.s.t", "name": "t", "columns": []}
+
+    with patch("databricks_mcp.api.unity_catalog_enhanced.make_api_request", new=AsyncMock(side_effect=fake_request)):
+        content = await unity_catalog_enhanced.describe_table_enhanced(
+            "c.s.t", include_lineage=True, response_format=ResponseFormat.JSON
+        )
+
+    data = json.loads(content)
+    assert data["table"]["name"] == "t"
+    assert data["lineage"]["error"] == "forbidden"
+
+
+def test_process_lineage_data_keeps_notebook_fields():
+    lineage = unity_catalog_enhanced._process_lineage_data({
+        "entities": [
+            {"entity_type": "NOTEBOOK", "name": "nb", "path": "/nb", "job_id": 1, "extra": "x"},
+            {"entity_type": "JOB", "name": "job"},
+        ],
+    })
+
+    assert lineage["notebooks"] == [
+        {"name": "nb", "path": "/nb", "job_id": 1, "job_name": None, "operations": []}
+    ]
+
+
+def test_format_columns_renames_type_name():
+    columns = [{"name": "id", "type_name": "INT", "nullable": False, "position": 0}]
+
+    assert unity_catalog_enhanced._format_columns(columns) == [
+        {"name": "id", "type": "INT", "comment": None, "nullable": False}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_describe_catalog_yields_on_large_schema_lists():
+    schemas = {"schemas": [{"name": f"s{i}"} for i in range(2500)]}
+
+    async def fake_request(method, endpoint, **kwargs):
+        return schemas if endpoint.endswith("/schemas") else {"name": "c"}
+
+    with (
+        patch("databricks_mcp.api.unity_catalog_enhanced.make_api_request", new=AsyncMock(side_effect=fake_request)),
+        patch("databricks_mcp.api.unity_catalog_enhanced.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        await unity_catalog_enhanced.describe_catalog_enhanced("c", response_format=ResponseFormat.JSON)
+
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_describe_catalog_markdown_lists_schema_owners_when_detailed():
+    async def fake_request(method, endpoint, **kwargs):
+        if endpoint.endswith("/schemas"):
+            return {"schemas": [{"name": "s1", "comment": "first", "owner": "me"}]}
+        return {"name": "c"}
+
+    with patch("databricks_mcp.api.unity_catalog_enhanced.make_api_request", new=AsyncMock(side_effect=fake_request)):
+        content = await unity_catalog_enhanced.describe_catalog_enhanced("c", detail_level=DetailLevel.DETAILED)
+
+    assert "### s1\n- first\n- Owner: me\n" in content
+
+
+@pytest.mark.asyncio
+async def test_list_catalogs_concise_json_keeps_name_and_comment():
+    catalogs = {"catalogs": [{"name": "main", "comment": "default", "owner": "me"}]}
+    with patch("databricks_mcp.api.unity_catalog_enhanced.make_api_request", new=AsyncMock(return_value=catalogs)):
+        content = await unity_catalog_enhanced.list_catalogs_enhanced(response_format=ResponseFormat.JSON)
+
+    assert json.loads(content) == {"catalogs": [{"name": "main", "comment": "default"}], "count": 1}
+
+
+
+@pytest.mark.asyncio
+async def test_list_catalogs_accepts_plain_format_strings():
+    catalogs = {"catalogs": [{"name": "main"}]}
+    with patch("databricks_mcp.api.unity_catalog_enhanced.make_api_request", new=AsyncMock(return_value=catalogs)):
+        markdown = await unity_catalog_enhanced.list_catalogs_enhanced(response_format="markdown")
+        fallback = await unity_catalog_enhanced.list_catalogs_enhanced(response_format="yaml")
+
+    assert markdown.startswith("# Unity Catalogs")
+    assert json.loads(fallback)["count"] == 1
+
+
+def test_dumps_encodes_dates_and_bytes():
+    data = json.loads(unity_catalog_enhanced._dumps({"day": datetime.date(2024, 1, 2), "raw": b"\x00\x01"}))
+
+    assert data == {"day": "2024-01-02", "raw": "AAE="}
+
+
+def test_dumps_keeps_naive_datetimes_without_offset():
+    text = unity_catalog_enhanced._dumps({"at": datetime.datetime(2024, 1, 2, 3, 4, 5), "name": "café"})
+
+    assert json.loads(text) == {"at": "2024-01-02T03:04:05", "name": "café"}
+    assert "café" in text
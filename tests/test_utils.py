@@ -0,0 +1,160 @@
+"""
+Tests for the core utility helpers.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from databricks_mcp.core import utils
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_shared_until_closed():
+    client = utils.get_client()
+    assert utils.get_client() is client
+
+    await utils.close_client()
+    assert client.is_closed
+
+    new_client = utils.get_client()
+    assert new_client is not client
+    await utils.close_client()
+    assert utils._request_semaphore is None
+
+
+def test_get_client_closes_client_of_a_loop_still_running_elsewhere():
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever)
+    thread.start()
+    try:
+        async def make():
+            return utils.get_client()
+
+        async def replace():
+            client = utils.get_client()
+            await utils.close_client()
+            return client
+
+        old = asyncio.run_coroutine_threadsafe(make(), other).result(timeout=5)
+        assert asyncio.run(replace()) is not old
+
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+        assert old.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join()
+        other.close()
+        utils._client = None
+        utils._client_loop = None
+
+
+@pytest.mark.asyncio
+async def test_make_api_request_parses_response_bytes():
+    response = MagicMock(content=b'{"clusters": [{"cluster_id": "c1"}]}')
+    client = utils.get_client()
+    with patch.object(client, "request", new=AsyncMock(return_value=response)):
+        result = await utils.make_api_request("GET", "/api/2.0/clusters/list")
+    await utils.close_client()
+
+    assert result == {"clusters": [{"cluster_id": "c1"}]}
+    response.json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_singleflight_coalesces_concurrent_calls():
+    calls = []
+
+    @utils.singleflight(ttl=60)
+    async def fetch(run_id):
+        calls.append(run_id)
+        await asyncio.sleep(0)
+        return {"run_id": run_id}
+
+    first, second, other = await asyncio.gather(fetch(1), fetch(1), fetch(2))
+
+    assert first is second
+    assert other == {"run_id": 2}
+    assert await fetch(1) is first
+    assert calls == [1, 2]
+
+
+def test_singleflight_reissues_calls_left_in_flight_on_another_loop():
+    calls = []
+
+    @utils.singleflight(ttl=60)
+    async def fetch():
+        calls.append(len(calls))
+        await asyncio.sleep(60 if len(calls) == 1 else 0)
+        return len(calls)
+
+    async def abandon():
+        asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(abandon())
+        assert asyncio.run(asyncio.wait_for(fetch(), timeout=1)) == 2
+    finally:
+        abandoned = asyncio.all_tasks(loop)
+        for task in abandoned:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*abandoned, return_exceptions=True))
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_reuses_and_invalidates():
+    calls = []
+
+    @utils.async_ttl_cache(ttl=60)
+    async def list_libraries(cluster_id):
+        calls.append(cluster_id)
+        return {"cluster_id": cluster_id}
+
+    await list_libraries("a")
+    await list_libraries(cluster_id="a")
+    assert calls == ["a"]
+
+    list_libraries.invalidate("a")
+    await list_libraries("a")
+    assert calls == ["a", "a"]
+
+    list_libraries.cache_clear()
+    await list_libraries("a")
+    assert calls == ["a", "a", "a"]
+
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_coalesces_and_drops_results_from_before_invalidate():
+    calls = []
+    started, release = asyncio.Event(), asyncio.Event()
+
+    @utils.async_ttl_cache(ttl=60)
+    async def list_schemas(catalog_name):
+        calls.append(catalog_name)
+        started.set()
+        await release.wait()
+        return {"schemas": len(calls)}
+
+    first = asyncio.ensure_future(list_schemas("main"))
+    second = asyncio.ensure_future(list_schemas("main"))
+    await started.wait()
+    assert calls == ["main"]
+
+    # A create lands while the listing is in flight
+    list_schemas.invalidate("main")
+    release.set()
+    assert await first is await second
+
+    assert await list_schemas("main") == {"schemas": 2}
+    assert await list_schemas("main") == {"schemas": 2}
+    assert calls == ["main", "main"]
+
+def test_json_dumps_accepts_non_string_keys():
+    assert json.loads(utils.json_dumps({1: "a", "b": [None, True]})) == {"1": "a", "b": [None, True]}